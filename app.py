@@ -3,12 +3,14 @@
 # Licensed under the MIT License. See LICENSE in the project root for license information.
 #-----------------------------------------------------------------------------------------
 
-import os
 from app import create_app
+from config import CONFIG, DevelopmentConfig
 
-# Create the application
-config_name = os.environ.get('FLASK_ENV', 'development')
-app = create_app(config_name)
+# Create the application with the configuration selected by FLASK_ENV
+app = create_app()
 
 if __name__ == '__main__':
+    if type(CONFIG) is not DevelopmentConfig:
+        # The Werkzeug server is single-process; use gunicorn.conf.py instead
+        raise SystemExit("Development server is disabled outside development; run 'gunicorn app:app'")
     app.run(host='0.0.0.0', port=9000, debug=True)
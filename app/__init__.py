@@ -1,15 +1,41 @@
 """Application factory for the Bloomberg AI Infrastructure Platform."""
-from flask import Flask
-from flask_cors import CORS
-from config import config
+from flask import Flask, abort, request
+from flask_compress import Compress
+from config import CONFIG, config
+from app.json_provider import ORJSONProvider
 
-def create_app(config_name='default'):
-    """Create and configure the Flask application."""
+def create_app(config_name=None):
+    """Create and configure the Flask application.
+
+    Uses the configuration selected by FLASK_ENV unless a config name is given.
+    """
     app = Flask(__name__, static_folder='../static', static_url_path='/static')
-    app.config.from_object(config[config_name])
+    app.config.from_object(CONFIG if config_name is None else config[config_name])
+    app.json = ORJSONProvider(app)
+
+    # Enable CORS for the configured origin
+    cors_origin = app.config['CORS_ORIGIN']
+    preflight_headers = {
+        'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
+        'Access-Control-Allow-Headers': 'Content-Type',
+        'Access-Control-Max-Age': '86400',
+    }
+
+    @app.before_request
+    def cors_preflight():
+        if request.method == 'OPTIONS':
+            return app.response_class(status=204, headers=preflight_headers)
+
+    @app.after_request
+    def cors_headers_hook(response):
+        response.headers['Access-Control-Allow-Origin'] = cors_origin
+        if cors_origin != '*':
+            # Add to, rather than replace, any Vary set by the view
+            response.vary.add('Origin')
+        return response
 
-    # Enable CORS
-    CORS(app)
+    # Compress large responses
+    Compress(app)
 
     # Register blueprints
     from app.api.bloomberg_routes import bloomberg_bp
@@ -22,6 +48,26 @@ def create_app(config_name='default'):
     app.register_blueprint(training_bp, url_prefix='/api/training')
     app.register_blueprint(dashboard_bp, url_prefix='/api/dashboard')
 
+    # Build services up front so gunicorn's preload_app shares them with
+    # forked workers. Bloomberg stays disconnected: sessions don't survive fork.
+    if app.config['PRELOAD_SERVICES']:
+        from app.api.ai_routes import get_ai_service
+        from app.api.bloomberg_routes import get_bloomberg_service, get_reference_batcher
+        from app.api.training_routes import get_training_service
+
+        with app.app_context():
+            get_ai_service()
+            get_bloomberg_service()
+            get_reference_batcher()
+            get_training_service()
+
+    # Reject oversized bodies before any route parses them
+    @app.before_request
+    def limit_content_length():
+        max_length = app.config['MAX_CONTENT_LENGTH']
+        if max_length and request.content_length and request.content_length > max_length:
+            abort(413)
+
     # Main route
     @app.route('/')
     def index():
@@ -1,6 +1,7 @@
 """AI Agent API routes."""
 from flask import Blueprint, jsonify, request, current_app
 from app.services.ai_service import AIAgentService
+from app.api.http_cache import cacheable
 
 ai_bp = Blueprint('ai', __name__)
 
@@ -13,7 +14,8 @@ def get_ai_service():
     if _ai_service is None:
         api_key = current_app.config.get('OPENAI_API_KEY', '')
         model = current_app.config.get('AI_MODEL', 'gpt-4')
-        _ai_service = AIAgentService(api_key=api_key, model=model)
+        cache_dir = current_app.config.get('CHAT_CACHE_DIR', '')
+        _ai_service = AIAgentService(api_key=api_key, model=model, cache_dir=cache_dir)
     return _ai_service
 
 
@@ -27,13 +29,19 @@ def chat():
         "context": []  // Optional conversation history
     }
     """
-    data = request.get_json()
+    data = request.get_json(silent=True) or {}
     message = data.get('message', '')
     context = data.get('context', [])
 
     if not message:
         return jsonify({"error": "No message provided"}), 400
 
+    if not isinstance(message, str):
+        return jsonify({"error": "message must be a string"}), 400
+
+    if not isinstance(context, list):
+        return jsonify({"error": "context must be a list"}), 400
+
     service = get_ai_service()
     response = service.chat(message, context)
 
@@ -58,16 +66,25 @@ def run_scenario():
         }
     }
     """
-    data = request.get_json()
+    data = request.get_json(silent=True) or {}
     scenario_type = data.get('type')
     parameters = data.get('parameters', {})
 
     if not scenario_type:
         return jsonify({"error": "No scenario type provided"}), 400
 
+    if not isinstance(scenario_type, str):
+        return jsonify({"error": "type must be a string"}), 400
+
+    if not isinstance(parameters, dict):
+        return jsonify({"error": "parameters must be an object"}), 400
+
     service = get_ai_service()
     result = service.run_scenario(scenario_type, parameters)
 
+    if "error" in result:
+        return jsonify(result), 400
+
     return jsonify({
         "success": True,
         "result": result
@@ -75,16 +92,28 @@ def run_scenario():
 
 
 @ai_bp.route('/knowledge', methods=['GET'])
+@cacheable
 def get_knowledge():
     """Get the AI agent's knowledge base."""
     service = get_ai_service()
-    return jsonify({
-        "success": True,
-        "knowledge": service.knowledge_base
-    })
+
+    # Serve a precompressed body when the client accepts one
+    for encoding, body in service._knowledge_encoded.items():
+        if request.accept_encodings[encoding]:
+            response = current_app.response_class(body, mimetype="application/json")
+            response.headers["Content-Encoding"] = encoding
+            response.set_etag(f"{service._knowledge_etag}-{encoding}")
+            break
+    else:
+        response = current_app.response_class(service._knowledge_json, mimetype="application/json")
+        response.set_etag(service._knowledge_etag)
+
+    response.vary.add("Accept-Encoding")
+    return response
 
 
 @ai_bp.route('/gpu-comparison', methods=['GET'])
+@cacheable
 def gpu_comparison():
     """Get GPU comparison data."""
     service = get_ai_service()
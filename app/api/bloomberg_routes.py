@@ -1,6 +1,9 @@
 """Bloomberg API routes for market data access."""
+import asyncio
+
 from flask import Blueprint, jsonify, request, current_app
-from app.services.bloomberg_service import BloombergService
+from app.services.bloomberg_service import BloombergService, ReferenceDataBatcher
+from app.api.http_cache import cacheable
 
 bloomberg_bp = Blueprint('bloomberg', __name__)
 
@@ -13,10 +16,27 @@ def get_bloomberg_service():
     if _bloomberg_service is None:
         host = current_app.config.get('BLOOMBERG_HOST', 'localhost')
         port = current_app.config.get('BLOOMBERG_PORT', 8194)
-        _bloomberg_service = BloombergService(host=host, port=port)
+        timeout = current_app.config.get('BLOOMBERG_TIMEOUT', 30000)
+        _bloomberg_service = BloombergService(host=host, port=port, timeout=timeout)
     return _bloomberg_service
 
 
+# Coalesces concurrent reference data requests (singleton)
+_reference_batcher = None
+
+def get_reference_batcher():
+    """Get or create the reference data batcher."""
+    global _reference_batcher
+    if _reference_batcher is None:
+        _reference_batcher = ReferenceDataBatcher(get_bloomberg_service())
+    return _reference_batcher
+
+
+def _is_str_list(value):
+    """Check that a request parameter is a list of strings."""
+    return isinstance(value, list) and all(isinstance(item, str) for item in value)
+
+
 @bloomberg_bp.route('/connect', methods=['POST'])
 def connect():
     """Connect to Bloomberg Terminal."""
@@ -51,7 +71,7 @@ def status():
 
 
 @bloomberg_bp.route('/reference-data', methods=['POST'])
-def reference_data():
+async def reference_data():
     """Get reference data for securities.
 
     Request body:
@@ -60,56 +80,67 @@ def reference_data():
         "fields": ["PX_LAST", "NAME", "CUR_MKT_CAP"]
     }
     """
-    service = get_bloomberg_service()
-
-    if not service.is_connected():
-        return jsonify({"error": "Not connected to Bloomberg"}), 400
-
-    data = request.get_json()
+    data = request.get_json(silent=True) or {}
     securities = data.get('securities', [])
     fields = data.get('fields', ['PX_LAST'])
 
     if not securities:
         return jsonify({"error": "No securities provided"}), 400
 
+    if not _is_str_list(securities) or not _is_str_list(fields):
+        return jsonify({"error": "securities and fields must be lists of strings"}), 400
+
+    service = get_bloomberg_service()
+
+    if not service.is_connected():
+        return jsonify({"error": "Not connected to Bloomberg"}), 400
+
     try:
-        result = service.get_reference_data(securities, fields)
+        batcher = get_reference_batcher()
+        result = await asyncio.wait_for(
+            asyncio.wrap_future(batcher.submit(securities, fields)), service.timeout / 1000
+        )
         return jsonify({
             "success": True,
             "data": result
         })
+    except asyncio.TimeoutError:
+        return jsonify({"error": "Bloomberg request timed out"}), 504
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
 @bloomberg_bp.route('/historical-data', methods=['POST'])
 def historical_data():
-    """Get historical data for a security.
+    """Get historical data for one or more securities.
 
     Request body:
     {
-        "security": "NVDA US Equity",
+        "security": "NVDA US Equity",  // Or "securities": ["NVDA US Equity", ...]
         "fields": ["PX_LAST"],
         "start_date": "20240101",
         "end_date": "20240301"
     }
-    """
-    service = get_bloomberg_service()
-
-    if not service.is_connected():
-        return jsonify({"error": "Not connected to Bloomberg"}), 400
 
-    data = request.get_json()
-    security = data.get('security')
+    A single "security" returns a list of data points; "securities" returns
+    the lists keyed by security.
+    """
+    data = request.get_json(silent=True) or {}
+    securities = data.get('securities') or data.get('security')
     fields = data.get('fields', ['PX_LAST'])
     start_date = data.get('start_date')
     end_date = data.get('end_date')
 
-    if not all([security, start_date, end_date]):
+    if not all([securities, start_date, end_date]):
         return jsonify({"error": "Missing required parameters"}), 400
 
+    service = get_bloomberg_service()
+
+    if not service.is_connected():
+        return jsonify({"error": "Not connected to Bloomberg"}), 400
+
     try:
-        result = service.get_historical_data(security, fields, start_date, end_date)
+        result = service.get_historical_data(securities, fields, start_date, end_date)
         return jsonify({
             "success": True,
             "data": result
@@ -119,6 +150,7 @@ def historical_data():
 
 
 @bloomberg_bp.route('/gpu-market', methods=['GET'])
+@cacheable
 def gpu_market():
     """Get GPU-related market data."""
     service = get_bloomberg_service()
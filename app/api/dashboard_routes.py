@@ -1,28 +1,35 @@
 """Dashboard API routes for unified data access."""
+import asyncio
+
 from flask import Blueprint, jsonify
-from app.services.bloomberg_service import BloombergService
-from app.services.ai_service import AIAgentService
-from app.services.training_service import TrainingService
+from app.api.bloomberg_routes import get_bloomberg_service
+from app.api.ai_routes import get_ai_service
+from app.api.training_routes import get_training_service
 
 dashboard_bp = Blueprint('dashboard', __name__)
 
 
-@dashboard_bp.route('/overview', methods=['GET'])
-def overview():
-    """Get dashboard overview data."""
-    # Initialize services
-    bloomberg = BloombergService()
-    ai_service = AIAgentService()
-    training = TrainingService()
-
+def _fetch_gpu_market_data(bloomberg):
+    """Connect to Bloomberg if needed and fetch GPU market data."""
     # Connect to Bloomberg (will use mock if unavailable)
-    bloomberg.connect()
+    if not bloomberg.is_connected():
+        bloomberg.connect()
+    return bloomberg.get_gpu_market_data()
 
-    # Get GPU market data
-    gpu_data = bloomberg.get_gpu_market_data()
 
-    # Get training progress
-    progress = training.get_user_progress()
+@dashboard_bp.route('/overview', methods=['GET'])
+async def overview():
+    """Get dashboard overview data."""
+    # Get shared services
+    bloomberg = get_bloomberg_service()
+    ai_service = get_ai_service()
+    training = get_training_service()
+
+    # Fetch market data and training progress concurrently
+    gpu_data, progress = await asyncio.gather(
+        asyncio.to_thread(_fetch_gpu_market_data, bloomberg),
+        asyncio.to_thread(training.get_user_progress)
+    )
 
     # Get knowledge base summary
     knowledge = ai_service.knowledge_base
@@ -52,9 +59,9 @@ def tco_calculator():
     }
     """
     from flask import request
-    data = request.get_json()
+    data = request.get_json(silent=True) or {}
 
-    ai_service = AIAgentService()
+    ai_service = get_ai_service()
     result = ai_service.run_scenario("tco", data)
 
     return jsonify({
@@ -76,9 +83,9 @@ def roi_calculator():
     }
     """
     from flask import request
-    data = request.get_json()
+    data = request.get_json(silent=True) or {}
 
-    ai_service = AIAgentService()
+    ai_service = get_ai_service()
     result = ai_service.run_scenario("roi", data)
 
     return jsonify({
@@ -0,0 +1,23 @@
+"""HTTP caching helpers for deterministic GET routes."""
+from functools import wraps
+from flask import current_app, make_response, request
+
+
+def cacheable(view):
+    """Mark a route's successful responses as publicly cacheable.
+
+    Adds ``Cache-Control: public, max-age=<HTTP_CACHE_MAX_AGE>`` and a strong
+    ETag (unless the view already set one), and answers matching
+    ``If-None-Match`` requests with 304 Not Modified.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        response = make_response(current_app.ensure_sync(view)(*args, **kwargs))
+        if response.status_code != 200:
+            return response
+
+        response.cache_control.public = True
+        response.cache_control.max_age = current_app.config.get('HTTP_CACHE_MAX_AGE', 60)
+        response.add_etag()
+        return response.make_conditional(request)
+    return wrapper
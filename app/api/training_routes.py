@@ -1,6 +1,9 @@
 """Training module API routes."""
-from flask import Blueprint, jsonify, request
+from dataclasses import asdict
+
+from flask import Blueprint, jsonify, request, current_app
 from app.services.training_service import TrainingService
+from app.api.http_cache import cacheable
 
 training_bp = Blueprint('training', __name__)
 
@@ -11,11 +14,13 @@ def get_training_service():
     """Get or create training service instance."""
     global _training_service
     if _training_service is None:
-        _training_service = TrainingService()
+        db_path = current_app.config.get('PROGRESS_DB_PATH', ':memory:')
+        _training_service = TrainingService(db_path=db_path)
     return _training_service
 
 
 @training_bp.route('/modules', methods=['GET'])
+@cacheable
 def list_modules():
     """Get list of available training modules."""
     service = get_training_service()
@@ -63,22 +68,28 @@ def submit_quiz(module_id, lesson_id):
     Request body:
     {
         "answers": [1, 2, 0],  // Array of answer indices
-        "user_id": "user123"   // Optional user ID
+        "user_id": "user123",  // Optional user ID
+        "verbose": true        // Optional, include per-question explanations
     }
     """
-    data = request.get_json()
+    data = request.get_json(silent=True) or {}
     answers = data.get('answers', [])
     user_id = data.get('user_id', 'default')
+    verbose = data.get('verbose', True)
+
+    if not isinstance(user_id, str) or not user_id:
+        return jsonify({"error": "user_id must be a non-empty string"}), 400
 
     service = get_training_service()
-    result = service.submit_quiz(module_id, lesson_id, answers, user_id)
+    result = service.submit_quiz(module_id, lesson_id, answers, user_id, verbose=verbose)
 
-    if "error" in result:
+    if isinstance(result, dict):
         return jsonify(result), 400
 
+    # Omit per-question results when the caller did not ask for them
     return jsonify({
         "success": True,
-        "result": result
+        "result": asdict(result, dict_factory=lambda items: {k: v for k, v in items if v is not None})
     })
 
 
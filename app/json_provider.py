@@ -0,0 +1,37 @@
+"""orjson-backed JSON provider for Flask responses and request parsing."""
+from types import MappingProxyType
+
+import orjson
+from flask.json.provider import DefaultJSONProvider, JSONProvider
+
+
+def _default(obj):
+    """Convert types orjson doesn't handle natively."""
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    return DefaultJSONProvider.default(obj)
+
+
+class ORJSONProvider(JSONProvider):
+    """JSON provider that serializes with orjson instead of the stdlib encoder.
+
+    Read-only mappings serialize as objects; other non-native types (Decimal,
+    objects with __html__) fall back to Flask's default conversion.
+    Non-finite floats serialize as null.
+    """
+
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(self, obj, **kwargs) -> str:
+        """Serialize data as a JSON string."""
+        return orjson.dumps(obj, default=_default, option=self.option).decode()
+
+    def loads(self, s, **kwargs):
+        """Deserialize data from a JSON string or bytes."""
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        """Build a JSON response without an intermediate str round-trip."""
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=_default, option=self.option)
+        return self._app.response_class(body, mimetype="application/json")
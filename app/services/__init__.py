@@ -1,6 +1,6 @@
 """Services package."""
-from app.services.bloomberg_service import BloombergService
+from app.services.bloomberg_service import BloombergService, ReferenceDataBatcher
 from app.services.ai_service import AIAgentService
 from app.services.training_service import TrainingService
 
-__all__ = ['BloombergService', 'AIAgentService', 'TrainingService']
+__all__ = ['BloombergService', 'ReferenceDataBatcher', 'AIAgentService', 'TrainingService']
@@ -1,10 +1,114 @@
 """AI Agent service for conversational assistance with GPU/datacenter analysis."""
+import gzip
+import hashlib
 import logging
-from typing import Dict, List, Any, Optional
+import os
+import re
+import sqlite3
+import sys
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Any, Mapping, Optional, Tuple
 import json
 
+import numpy as np
+import orjson
+
+from app.services.immutable import freeze
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
 logger = logging.getLogger(__name__)
 
+# Response cache settings
+CACHE_MAX_ENTRIES = 1024
+CACHE_SIMILARITY_THRESHOLD = 0.9
+EMBEDDING_MODEL = 'sentence-transformers/all-MiniLM-L6-v2'
+DISK_CACHE_SIZE_LIMIT = 1 << 30
+DISK_CACHE_TTL = 3600
+
+# Response cache key: (intent, normalized message, ((role, content), ...) of the context)
+CacheKey = Tuple[str, str, Tuple[Tuple[str, str], ...]]
+
+# Intent keywords in priority order; matched as case-insensitive substrings
+_INTENT_KEYWORDS = [
+    ("tco_calculation", ['tco', 'cost', 'expense', 'budget', 'pricing']),
+    ("gpu_comparison", ['compare', 'vs', 'versus', 'difference', 'better']),
+    ("market_data", ['market', 'stock', 'price', 'bloomberg', 'equity']),
+    ("neocloud_analysis", ['neocloud', 'coreweave', 'lambda', 'together', 'cloud provider']),
+]
+_INTENT_PATTERNS = [
+    (intent, re.compile('|'.join(map(re.escape, words)), re.IGNORECASE))
+    for intent, words in _INTENT_KEYWORDS
+]
+
+
+def _check_numbers(values: Dict[str, Any], positive: Tuple[str, ...] = ()) -> Optional[str]:
+    """Return an error message unless every value is a number, and positive where required."""
+    for name, value in values.items():
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return f"{name} must be a number"
+        if name in positive and not value > 0:
+            return f"{name} must be positive"
+    return None
+
+
+# Domain knowledge for AI infrastructure analysis, shared read-only by all
+# service instances
+_KNOWLEDGE_BASE = freeze({
+    "gpu_architectures": {
+        "H100": {
+            "manufacturer": "NVIDIA",
+            "process": "4nm",
+            "memory": "80GB HBM3",
+            "tdp": 700,
+            "fp16_tflops": 1979,
+            "price_estimate": 30000
+        },
+        "H200": {
+            "manufacturer": "NVIDIA",
+            "process": "4nm",
+            "memory": "141GB HBM3e",
+            "tdp": 700,
+            "fp16_tflops": 1979,
+            "price_estimate": 40000
+        },
+        "MI300X": {
+            "manufacturer": "AMD",
+            "process": "5nm",
+            "memory": "192GB HBM3",
+            "tdp": 750,
+            "fp16_tflops": 1307,
+            "price_estimate": 15000
+        },
+        "B200": {
+            "manufacturer": "NVIDIA",
+            "process": "4nm",
+            "memory": "192GB HBM3e",
+            "tdp": 1000,
+            "fp16_tflops": 4500,
+            "price_estimate": 40000
+        }
+    },
+    "tco_factors": {
+        "power_cost_kwh": 0.08,
+        "pue": 1.3,
+        "cooling_overhead": 0.15,
+        "maintenance_percent": 0.08,
+        "depreciation_years": 3,
+        "utilization_target": 0.85
+    },
+    "neocloud_providers": {
+        "CoreWeave": {"focus": "GPU cloud", "gpu_types": ["H100", "A100"]},
+        "Lambda Labs": {"focus": "ML cloud", "gpu_types": ["H100", "A100"]},
+        "Together AI": {"focus": "Inference", "gpu_types": ["H100"]},
+        "Crusoe": {"focus": "Clean energy", "gpu_types": ["H100", "A100"]}
+    }
+})
+
 class AIAgentService:
     """AI Agent for GPU economics, datacenter TCO, and neocloud analysis.
 
@@ -15,72 +119,79 @@ class AIAgentService:
     - Integrating Bloomberg data insights
     """
 
-    def __init__(self, api_key: str = '', model: str = 'gpt-4'):
+    def __init__(self, api_key: str = '', model: str = 'gpt-4', cache_dir: str = ''):
         """Initialize AI Agent service.
 
         Args:
             api_key: OpenAI or Anthropic API key
             model: Model to use for responses
+            cache_dir: Directory for the persistent response cache (disabled if empty)
         """
         self.api_key = api_key
         self.model = model
         self._client = None
 
+        # Semantic response cache: LRU of (intent, message, context) -> response,
+        # with a fixed-size embedding matrix for near-duplicate lookups. Each
+        # embedded key owns one row, written and cleared in place; the matrix
+        # is allocated on the first embedding, once its width is known.
+        self._cache: "OrderedDict[CacheKey, Dict[str, Any]]" = OrderedDict()
+        self._cache_matrix: Optional[np.ndarray] = None
+        self._cache_slot_used = np.zeros(CACHE_MAX_ENTRIES, dtype=bool)
+        self._cache_slot_keys: List[Optional[CacheKey]] = [None] * CACHE_MAX_ENTRIES
+        self._cache_slots: Dict[CacheKey, int] = {}
+        self._cache_free_slots = list(range(CACHE_MAX_ENTRIES - 1, -1, -1))
+        self._cache_lock = threading.Lock()
+        self._embedder = None
+        self._embedder_available = True
+        self._embedder_lock = threading.Lock()
+
+        # Persistent second-level cache shared across workers and restarts,
+        # opened lazily so each forked worker gets its own connection
+        self._cache_dir = cache_dir
+        self._disk_cache = None
+        self._disk_cache_pid = None
+
+        # Dispatch tables for chat intents and analysis scenarios
+        self._intent_handlers = {
+            "tco_calculation": self._handle_tco_query,
+            "gpu_comparison": self._handle_gpu_comparison,
+            "market_data": self._handle_market_query,
+            "neocloud_analysis": self._handle_neocloud_query,
+        }
+        self._scenario_handlers = {
+            "tco": self._calculate_custom_tco,
+            "roi": self._calculate_roi,
+        }
+
         # Knowledge base for AI infrastructure domain
         self.knowledge_base = self._load_knowledge_base()
 
-    def _load_knowledge_base(self) -> Dict[str, Any]:
+        # GPU numerics as parallel arrays (indexed like _gpu_names) for vectorized math
+        gpus = self.knowledge_base["gpu_architectures"]
+        self._gpu_names = list(gpus)
+        self._gpu_tdp = np.array([g["tdp"] for g in gpus.values()], dtype=np.float64)
+        self._gpu_tflops = np.array([g["fp16_tflops"] for g in gpus.values()], dtype=np.float64)
+        self._gpu_price = np.array([g["price_estimate"] for g in gpus.values()], dtype=np.float64)
+
+        # Serialized /knowledge response body and its ETag, built once
+        self._knowledge_json = orjson.dumps({"success": True, "knowledge": self.knowledge_base}, default=dict)
+        self._knowledge_etag = hashlib.md5(self._knowledge_json, usedforsecurity=False).hexdigest()
+
+        # Precompressed /knowledge bodies keyed by content coding, in preference order
+        self._knowledge_encoded = {}
+        if brotli is not None:
+            self._knowledge_encoded["br"] = brotli.compress(self._knowledge_json, quality=11)
+        self._knowledge_encoded["gzip"] = gzip.compress(self._knowledge_json, compresslevel=9)
+
+        # Deterministic responses over the static knowledge base, built once
+        self._default_tco_response = self._build_default_tco_response()
+        self._gpu_comparison = self._build_gpu_comparison()
+        self._general_response = self._build_general_response()
+
+    def _load_knowledge_base(self) -> Mapping[str, Any]:
         """Load domain knowledge for AI infrastructure analysis."""
-        return {
-            "gpu_architectures": {
-                "H100": {
-                    "manufacturer": "NVIDIA",
-                    "process": "4nm",
-                    "memory": "80GB HBM3",
-                    "tdp": 700,
-                    "fp16_tflops": 1979,
-                    "price_estimate": 30000
-                },
-                "H200": {
-                    "manufacturer": "NVIDIA",
-                    "process": "4nm",
-                    "memory": "141GB HBM3e",
-                    "tdp": 700,
-                    "fp16_tflops": 1979,
-                    "price_estimate": 40000
-                },
-                "MI300X": {
-                    "manufacturer": "AMD",
-                    "process": "5nm",
-                    "memory": "192GB HBM3",
-                    "tdp": 750,
-                    "fp16_tflops": 1307,
-                    "price_estimate": 15000
-                },
-                "B200": {
-                    "manufacturer": "NVIDIA",
-                    "process": "4nm",
-                    "memory": "192GB HBM3e",
-                    "tdp": 1000,
-                    "fp16_tflops": 4500,
-                    "price_estimate": 40000
-                }
-            },
-            "tco_factors": {
-                "power_cost_kwh": 0.08,
-                "pue": 1.3,
-                "cooling_overhead": 0.15,
-                "maintenance_percent": 0.08,
-                "depreciation_years": 3,
-                "utilization_target": 0.85
-            },
-            "neocloud_providers": {
-                "CoreWeave": {"focus": "GPU cloud", "gpu_types": ["H100", "A100"]},
-                "Lambda Labs": {"focus": "ML cloud", "gpu_types": ["H100", "A100"]},
-                "Together AI": {"focus": "Inference", "gpu_types": ["H100"]},
-                "Crusoe": {"focus": "Clean energy", "gpu_types": ["H100", "A100"]}
-            }
-        }
+        return _KNOWLEDGE_BASE
 
     def chat(self, message: str, context: Optional[List[Dict]] = None) -> Dict[str, Any]:
         """Process a chat message and return AI response.
@@ -92,38 +203,191 @@ class AIAgentService:
         Returns:
             Response with answer and any relevant data
         """
-        # Analyze message intent
+        # Intent matching is a few regex searches; keying on it keeps
+        # near-duplicate hits from crossing into another intent's answer
         intent = self._analyze_intent(message)
-
-        # Generate response based on intent
-        if intent == "tco_calculation":
-            return self._handle_tco_query(message)
-        elif intent == "gpu_comparison":
-            return self._handle_gpu_comparison(message)
-        elif intent == "market_data":
-            return self._handle_market_query(message)
-        elif intent == "neocloud_analysis":
-            return self._handle_neocloud_query(message)
-        else:
-            return self._handle_general_query(message)
+        key = (intent, message.strip().lower(), self._context_key(context))
+
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        cached = self._disk_cache_get(key)
+        if cached is not None:
+            self._cache_set(key, None, cached)
+            return cached
+
+        emb = self._embed(key[1])
+        cached = self._cache_get_similar(key, emb)
+        if cached is not None:
+            return cached
+
+        response = self._respond(message, intent)
+        self._cache_set(key, emb, response)
+        self._disk_cache_set(key, response)
+        return response
+
+    def _respond(self, message: str, intent: str) -> Dict[str, Any]:
+        """Route a message to the handler for its intent."""
+        handler = self._intent_handlers.get(intent, self._handle_general_query)
+        return handler(message)
+
+    @staticmethod
+    def _context_key(context: Optional[List[Dict]]) -> Tuple[Tuple[str, str], ...]:
+        """Build a hashable key for the conversation context.
+
+        Keeps cache hits from crossing conversations. Tuples cache their
+        element hashes, so lookups avoid re-serializing the context.
+        """
+        if not context or not isinstance(context, (list, tuple)):
+            return ()
+        return tuple(
+            (sys.intern(str(turn.get("role", ""))), str(turn.get("content", "")))
+            if isinstance(turn, dict) else ("", str(turn))
+            for turn in context
+        )
+
+    def _embed(self, text: str) -> Optional[np.ndarray]:
+        """Return a normalized sentence embedding, or None if unavailable."""
+        if self._embedder is None:
+            # Load the model once even if several first requests race here
+            with self._embedder_lock:
+                if self._embedder is None:
+                    if not self._embedder_available:
+                        return None
+                    try:
+                        from sentence_transformers import SentenceTransformer
+                        self._embedder = SentenceTransformer(EMBEDDING_MODEL)
+                    except ImportError:
+                        logger.warning("sentence-transformers not installed. Chat cache will use exact matching only.")
+                        self._embedder_available = False
+                        return None
+        return self._embedder.encode(text, normalize_embeddings=True)
+
+    def _get_disk_cache(self):
+        """Return this process's disk cache handle, or None if disabled."""
+        if not self._cache_dir:
+            return None
+        if self._disk_cache is None or self._disk_cache_pid != os.getpid():
+            try:
+                from diskcache import Cache
+            except ImportError:
+                logger.warning("diskcache not installed. Chat responses will only be cached in memory.")
+                self._cache_dir = ''
+                return None
+            try:
+                self._disk_cache = Cache(self._cache_dir, size_limit=DISK_CACHE_SIZE_LIMIT)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning("Cannot open chat cache at %s: %s. Chat responses will only be cached in memory.",
+                               self._cache_dir, e)
+                self._cache_dir = ''
+                return None
+            self._disk_cache_pid = os.getpid()
+        return self._disk_cache
+
+    @staticmethod
+    def _disk_key(key: CacheKey) -> str:
+        """Build a process-independent digest of a cache key for the disk cache."""
+        digest = hashlib.blake2b(f"{key[0]}\x00{key[1]}".encode())
+        for role, content in key[2]:
+            digest.update(f"\x00{role}\x01{content}".encode())
+        return digest.hexdigest()
+
+    def _disk_cache_get(self, key: CacheKey) -> Optional[Dict[str, Any]]:
+        """Look up a response in the persistent cache."""
+        disk_cache = self._get_disk_cache()
+        if disk_cache is None:
+            return None
+        try:
+            payload = disk_cache.get(self._disk_key(key))
+        except Exception as e:
+            logger.warning("Disk cache read failed: %s", e)
+            return None
+        return orjson.loads(payload) if payload is not None else None
+
+    def _disk_cache_set(self, key: CacheKey, response: Dict[str, Any]):
+        """Store a response in the persistent cache as JSON."""
+        disk_cache = self._get_disk_cache()
+        if disk_cache is None:
+            return
+        try:
+            payload = orjson.dumps(response, default=dict)
+            disk_cache.set(self._disk_key(key), payload, expire=DISK_CACHE_TTL)
+        except Exception as e:
+            logger.warning("Disk cache write failed: %s", e)
+
+    def _cache_get(self, key: CacheKey) -> Optional[Dict[str, Any]]:
+        """Look up a cached response by exact key."""
+        with self._cache_lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+            return None
+
+    def _cache_get_similar(self, key: CacheKey, emb: Optional[np.ndarray]) -> Optional[Dict[str, Any]]:
+        """Look up a cached response for a near-duplicate message."""
+        if emb is None:
+            return None
+
+        with self._cache_lock:
+            if not self._cache_slots:
+                return None
+
+            sims = np.where(self._cache_slot_used, self._cache_matrix @ emb, -np.inf)
+            # Only consider entries with the same intent and conversation context
+            for i in np.argsort(-sims):
+                if sims[i] <= CACHE_SIMILARITY_THRESHOLD:
+                    break
+                match = self._cache_slot_keys[i]
+                if match[0] == key[0] and match[2] == key[2]:
+                    self._cache.move_to_end(match)
+                    return self._cache[match]
+            return None
+
+    def _cache_set(self, key: CacheKey, emb: Optional[np.ndarray], response: Dict[str, Any]):
+        """Store a response, evicting the least recently used entry when full."""
+        with self._cache_lock:
+            # Evict first so a new key always finds a free embedding row
+            if key not in self._cache:
+                while len(self._cache) >= CACHE_MAX_ENTRIES:
+                    evicted, _ = self._cache.popitem(last=False)
+                    self._cache_clear_slot(evicted)
+
+            self._cache[key] = response
+            self._cache.move_to_end(key)
+            if emb is not None:
+                if self._cache_matrix is None:
+                    self._cache_matrix = np.zeros((CACHE_MAX_ENTRIES, emb.shape[0]), dtype=emb.dtype)
+                slot = self._cache_slots.get(key)
+                if slot is None:
+                    slot = self._cache_slots[key] = self._cache_free_slots.pop()
+                    self._cache_slot_keys[slot] = key
+                    self._cache_slot_used[slot] = True
+                self._cache_matrix[slot] = emb
+
+    def _cache_clear_slot(self, key: CacheKey):
+        """Release an evicted key's embedding row. Caller holds _cache_lock."""
+        slot = self._cache_slots.pop(key, None)
+        if slot is None:
+            return
+        self._cache_matrix[slot] = 0
+        self._cache_slot_used[slot] = False
+        self._cache_slot_keys[slot] = None
+        self._cache_free_slots.append(slot)
 
     def _analyze_intent(self, message: str) -> str:
         """Analyze message to determine intent."""
-        message_lower = message.lower()
-
-        if any(word in message_lower for word in ['tco', 'cost', 'expense', 'budget', 'pricing']):
-            return "tco_calculation"
-        elif any(word in message_lower for word in ['compare', 'vs', 'versus', 'difference', 'better']):
-            return "gpu_comparison"
-        elif any(word in message_lower for word in ['market', 'stock', 'price', 'bloomberg', 'equity']):
-            return "market_data"
-        elif any(word in message_lower for word in ['neocloud', 'coreweave', 'lambda', 'together', 'cloud provider']):
-            return "neocloud_analysis"
-        else:
-            return "general"
+        for intent, pattern in _INTENT_PATTERNS:
+            if pattern.search(message):
+                return intent
+        return "general"
 
     def _handle_tco_query(self, message: str) -> Dict[str, Any]:
         """Handle TCO-related queries."""
+        return self._default_tco_response
+
+    def _build_default_tco_response(self) -> Dict[str, Any]:
+        """Build the default 8x H100 TCO breakdown from the knowledge base."""
         factors = self.knowledge_base["tco_factors"]
 
         # Calculate sample TCO for H100 cluster
@@ -170,30 +434,43 @@ Want me to adjust any parameters for a custom scenario?""",
 
     def _handle_gpu_comparison(self, message: str) -> Dict[str, Any]:
         """Handle GPU comparison queries."""
+        return self._gpu_comparison
+
+    def _build_gpu_comparison(self) -> Dict[str, Any]:
+        """Build the GPU comparison table from the knowledge base."""
         gpus = self.knowledge_base["gpu_architectures"]
 
+        perf_per_dollar = np.round(self._gpu_tflops / (self._gpu_price / 1000), 2)
+
+        # Sort by performance per dollar
+        order = np.argsort(-perf_per_dollar, kind="stable")
+
         comparison_table = []
-        for name, specs in gpus.items():
+        for i in order:
+            name = self._gpu_names[i]
+            specs = gpus[name]
             comparison_table.append({
                 "name": name,
                 "memory": specs["memory"],
                 "tdp": specs["tdp"],
                 "fp16_tflops": specs["fp16_tflops"],
                 "price": specs["price_estimate"],
-                "perf_per_dollar": round(specs["fp16_tflops"] / (specs["price_estimate"] / 1000), 2)
+                "perf_per_dollar": float(perf_per_dollar[i])
             })
 
-        # Sort by performance per dollar
-        comparison_table.sort(key=lambda x: x["perf_per_dollar"], reverse=True)
-
-        response = "**GPU Comparison for AI Training:**\n\n"
-        response += "| GPU | Memory | TDP | FP16 TFLOPS | Est. Price | Perf/$ |\n"
-        response += "|-----|--------|-----|-------------|------------|--------|\n"
-
-        for gpu in comparison_table:
-            response += f"| {gpu['name']} | {gpu['memory']} | {gpu['tdp']}W | {gpu['fp16_tflops']} | ${gpu['price']:,} | {gpu['perf_per_dollar']} |\n"
-
-        response += "\n*Performance per dollar = FP16 TFLOPS per $1000*"
+        rows = [
+            "**GPU Comparison for AI Training:**",
+            "",
+            "| GPU | Memory | TDP | FP16 TFLOPS | Est. Price | Perf/$ |",
+            "|-----|--------|-----|-------------|------------|--------|",
+        ]
+        rows.extend(
+            f"| {gpu['name']} | {gpu['memory']} | {gpu['tdp']}W | {gpu['fp16_tflops']} | ${gpu['price']:,} | {gpu['perf_per_dollar']} |"
+            for gpu in comparison_table
+        )
+        rows.append("")
+        rows.append("*Performance per dollar = FP16 TFLOPS per $1000*")
+        response = "\n".join(rows)
 
         return {
             "response": response,
@@ -224,32 +501,36 @@ Would you like me to explain how to set up the Bloomberg connection?""",
         """Handle neocloud provider queries."""
         providers = self.knowledge_base["neocloud_providers"]
 
-        response = "**Neocloud Provider Overview:**\n\n"
+        parts = ["**Neocloud Provider Overview:**\n\n"]
 
         for name, info in providers.items():
-            response += f"**{name}**\n"
-            response += f"- Focus: {info['focus']}\n"
-            response += f"- Available GPUs: {', '.join(info['gpu_types'])}\n\n"
+            parts.append(f"**{name}**\n")
+            parts.append(f"- Focus: {info['focus']}\n")
+            parts.append(f"- Available GPUs: {', '.join(info['gpu_types'])}\n\n")
 
-        response += """
+        parts.append("""
 **Key Differentiators:**
 - CoreWeave: Kubernetes-native, competitive pricing
 - Lambda Labs: Developer-focused, simple API
 - Together AI: Optimized for inference workloads
 - Crusoe: Sustainable energy focus
 
-Would you like a detailed pricing comparison or availability analysis?"""
+Would you like a detailed pricing comparison or availability analysis?""")
 
         return {
-            "response": response,
+            "response": "".join(parts),
             "data": providers,
             "intent": "neocloud_analysis"
         }
 
     def _handle_general_query(self, message: str) -> Dict[str, Any]:
         """Handle general queries about AI infrastructure."""
+        return self._general_response
+
+    def _build_general_response(self) -> Dict[str, Any]:
+        """Build the capabilities overview returned for general queries."""
         return {
-            "response": f"""I can help you with:
+            "response": """I can help you with:
 
 1. **TCO Calculations** - Calculate total cost of ownership for GPU clusters
 2. **GPU Comparisons** - Compare H100, H200, MI300X, B200 specifications
@@ -271,12 +552,10 @@ What would you like to explore?""",
         Returns:
             Scenario results
         """
-        if scenario_type == "tco":
-            return self._calculate_custom_tco(parameters)
-        elif scenario_type == "roi":
-            return self._calculate_roi(parameters)
-        else:
+        calculator = self._scenario_handlers.get(scenario_type)
+        if calculator is None:
             return {"error": f"Unknown scenario type: {scenario_type}"}
+        return calculator(parameters)
 
     def _calculate_custom_tco(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate custom TCO based on parameters."""
@@ -285,24 +564,23 @@ What would you like to explore?""",
         power_rate = params.get("power_rate", 0.08)
         years = params.get("years", 3)
 
-        gpu_specs = self.knowledge_base["gpu_architectures"].get(gpu_type, {})
-        gpu_price = gpu_specs.get("price_estimate", 30000)
-        tdp = gpu_specs.get("tdp", 700)
+        error = _check_numbers({"num_gpus": num_gpus, "power_rate": power_rate, "years": years},
+                               positive=("num_gpus", "years"))
+        if not isinstance(gpu_type, str):
+            error = "gpu_type must be a string"
+        if error:
+            return {"error": error}
 
-        capex = gpu_price * num_gpus
-        annual_power = (tdp * num_gpus * 8760 * 1.3 / 1000) * power_rate
-        annual_maintenance = capex * 0.08
-
-        total_tco = capex + (annual_power + annual_maintenance) * years
+        result = self.batch_tco([gpu_type], num_gpus, power_rate, years)
 
         return {
             "gpu_type": gpu_type,
             "num_gpus": num_gpus,
-            "capex": capex,
-            "annual_power": annual_power,
-            "annual_maintenance": annual_maintenance,
-            "total_tco": total_tco,
-            "tco_per_gpu_hour": total_tco / (num_gpus * 8760 * years)
+            "capex": result["capex"].item(),
+            "annual_power": result["annual_power"].item(),
+            "annual_maintenance": result["annual_maintenance"].item(),
+            "total_tco": result["total_tco"].item(),
+            "tco_per_gpu_hour": result["tco_per_gpu_hour"].item()
         }
 
     def _calculate_roi(self, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -312,12 +590,93 @@ What would you like to explore?""",
         utilization = params.get("utilization", 0.85)
         num_gpus = params.get("num_gpus", 8)
 
+        error = _check_numbers({"investment": investment, "hourly_rate": hourly_rate,
+                                "utilization": utilization, "num_gpus": num_gpus},
+                               positive=("investment",))
+        if error:
+            return {"error": error}
+
+        result = self.batch_roi(investment, hourly_rate, utilization, num_gpus)
+
+        return {
+            "investment": investment,
+            "annual_revenue": result["annual_revenue"].item(),
+            "annual_costs": result["annual_costs"].item(),
+            "annual_profit": result["annual_profit"].item(),
+            "roi_percent": result["roi_percent"].item(),
+            "payback_months": result["payback_months"].item()
+        }
+
+    def batch_tco(self, gpu_types, num_gpus, power_rates, years) -> Dict[str, np.ndarray]:
+        """Calculate TCO for many scenarios at once.
+
+        All arguments broadcast against each other, so a parameter sweep can
+        pass a grid for one input and scalars for the rest.
+
+        Args:
+            gpu_types: GPU model names (unknown models use H100 price and TDP)
+            num_gpus: GPUs per cluster
+            power_rates: Power cost in $/kWh
+            years: Ownership period in years
+
+        Returns:
+            Dictionary of result arrays (capex, annual_power, annual_maintenance,
+            total_tco, tco_per_gpu_hour)
+        """
+        index = {name: i for i, name in enumerate(self._gpu_names)}
+        idx = np.array([index.get(g, -1) for g in np.atleast_1d(gpu_types)])
+
+        # Index -1 selects the appended default for unknown GPU types
+        gpu_price = np.append(self._gpu_price, 30000)[idx]
+        tdp = np.append(self._gpu_tdp, 700)[idx]
+
+        num_gpus = np.asarray(num_gpus, dtype=np.float64)
+        power_rates = np.asarray(power_rates, dtype=np.float64)
+        years = np.asarray(years, dtype=np.float64)
+
+        capex = gpu_price * num_gpus
+        annual_power = (tdp * num_gpus * 8760 * 1.3 / 1000) * power_rates
+        annual_maintenance = capex * 0.08
+
+        total_tco = capex + (annual_power + annual_maintenance) * years
+
+        # Zero GPUs or years give inf/nan for those scenarios instead of warning
+        with np.errstate(divide='ignore', invalid='ignore'):
+            tco_per_gpu_hour = total_tco / (num_gpus * 8760 * years)
+
+        return {
+            "capex": capex,
+            "annual_power": annual_power,
+            "annual_maintenance": annual_maintenance,
+            "total_tco": total_tco,
+            "tco_per_gpu_hour": tco_per_gpu_hour
+        }
+
+    def batch_roi(self, investment, hourly_rate, utilization, num_gpus) -> Dict[str, np.ndarray]:
+        """Calculate ROI for many GPU investment scenarios at once.
+
+        All arguments broadcast against each other. Scenarios that never turn
+        a profit get an infinite payback period.
+
+        Returns:
+            Dictionary of result arrays (investment, annual_revenue, annual_costs,
+            annual_profit, roi_percent, payback_months)
+        """
+        investment = np.asarray(investment, dtype=np.float64)
+        hourly_rate = np.asarray(hourly_rate, dtype=np.float64)
+        utilization = np.asarray(utilization, dtype=np.float64)
+        num_gpus = np.asarray(num_gpus, dtype=np.float64)
+
         annual_revenue = hourly_rate * num_gpus * 8760 * utilization
         annual_costs = investment * 0.4  # Simplified opex
 
         annual_profit = annual_revenue - annual_costs
-        roi = (annual_profit / investment) * 100
-        payback_months = (investment / annual_profit) * 12 if annual_profit > 0 else float('inf')
+        # A zero investment gives inf/nan for that scenario instead of warning
+        with np.errstate(divide='ignore', invalid='ignore'):
+            roi = (annual_profit / investment) * 100
+
+        payback_months = np.full(np.shape(annual_profit), np.inf)
+        np.divide(investment * 12, annual_profit, out=payback_months, where=annual_profit > 0)
 
         return {
             "investment": investment,
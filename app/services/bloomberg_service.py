@@ -1,10 +1,123 @@
 """Bloomberg API integration service for Desktop API and Server API connections."""
+import asyncio
+import itertools
 import logging
-from typing import Optional, Dict, List, Any
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Optional, Dict, List, Any, Tuple, Callable, NamedTuple, Sequence, Union
 from datetime import datetime
 
+import numpy as np
+
+from app.services.immutable import freeze
+
 logger = logging.getLogger(__name__)
 
+# Reference data cache: seconds each field stays fresh, and maximum entries
+REFERENCE_DEFAULT_TTL = 60
+REFERENCE_FIELD_TTLS = {
+    "NAME": 24 * 60 * 60,
+    "CUR_MKT_CAP": 24 * 60 * 60,
+}
+REFERENCE_CACHE_MAX_KEYS = 256
+
+# Milliseconds the event reader waits for each event; bounds shutdown latency
+# and how often request deadlines are checked
+EVENT_POLL_INTERVAL = 1000
+
+# Securities and fields for the GPU market and datacenter REIT panels
+_GPU_SECURITIES = (
+    "NVDA US Equity",   # NVIDIA
+    "AMD US Equity",    # AMD
+    "INTC US Equity",   # Intel
+    "TSM US Equity",    # TSMC
+    "AVGO US Equity",   # Broadcom
+)
+_GPU_FIELDS = (
+    "PX_LAST",          # Last price
+    "CHG_PCT_1D",       # 1-day change %
+    "CUR_MKT_CAP",      # Market cap
+    "PE_RATIO",         # P/E ratio
+    "BEST_EPS_1YR",     # Forward EPS
+)
+_REIT_SECURITIES = (
+    "EQIX US Equity",   # Equinix
+    "DLR US Equity",    # Digital Realty
+    "AMT US Equity",    # American Tower
+    "CCI US Equity",    # Crown Castle
+)
+_REIT_FIELDS = (
+    "PX_LAST",
+    "DVD_YLD",          # Dividend yield
+    "FUNDS_FROM_OPS",   # FFO
+    "CUR_MKT_CAP",
+)
+
+# Canned reference data served when blpapi is not installed
+_MOCK_REFERENCE_DATA = freeze({
+    "NVDA US Equity": {
+        "PX_LAST": "875.28", "CHG_PCT_1D": "2.34",
+        "CUR_MKT_CAP": "2150000000000", "PE_RATIO": "65.2", "BEST_EPS_1YR": "13.42",
+        "NAME": "NVIDIA Corp"
+    },
+    "AMD US Equity": {
+        "PX_LAST": "178.45", "CHG_PCT_1D": "1.82",
+        "CUR_MKT_CAP": "288000000000", "PE_RATIO": "48.7", "BEST_EPS_1YR": "3.66",
+        "NAME": "Advanced Micro Devices Inc"
+    },
+    "INTC US Equity": {
+        "PX_LAST": "31.24", "CHG_PCT_1D": "-0.45",
+        "CUR_MKT_CAP": "132000000000", "PE_RATIO": "32.1", "BEST_EPS_1YR": "0.97",
+        "NAME": "Intel Corp"
+    },
+    "TSM US Equity": {
+        "PX_LAST": "142.67", "CHG_PCT_1D": "1.12",
+        "CUR_MKT_CAP": "740000000000", "PE_RATIO": "24.8", "BEST_EPS_1YR": "5.75",
+        "NAME": "Taiwan Semiconductor Manufacturing Co Ltd"
+    },
+    "AVGO US Equity": {
+        "PX_LAST": "1324.56", "CHG_PCT_1D": "0.89",
+        "CUR_MKT_CAP": "615000000000", "PE_RATIO": "35.6", "BEST_EPS_1YR": "37.21",
+        "NAME": "Broadcom Inc"
+    },
+    "EQIX US Equity": {
+        "PX_LAST": "812.34", "DVD_YLD": "2.1",
+        "FUNDS_FROM_OPS": "32.45", "CUR_MKT_CAP": "76000000000",
+        "NAME": "Equinix Inc"
+    },
+    "DLR US Equity": {
+        "PX_LAST": "142.89", "DVD_YLD": "3.4",
+        "FUNDS_FROM_OPS": "6.78", "CUR_MKT_CAP": "44000000000",
+        "NAME": "Digital Realty Trust Inc"
+    },
+})
+
+
+def _settle(future: Future, result: Any = None, exception: Optional[BaseException] = None):
+    """Complete a future unless its waiter has already cancelled it.
+
+    Async callers wrap these futures in ``asyncio.wait_for``, which cancels
+    them on timeout; setting a result on a cancelled future would raise.
+    """
+    if not future.set_running_or_notify_cancel():
+        return
+    if exception is not None:
+        future.set_exception(exception)
+    else:
+        future.set_result(result)
+
+
+class _PendingRequest(NamedTuple):
+    """An in-flight Bloomberg request awaiting its RESPONSE event."""
+    future: Future
+    parse: Callable[[Any, Any], None]
+    results: Any
+    deadline: float
+
+
 class BloombergService:
     """Service for Bloomberg Terminal API integration.
 
@@ -12,19 +125,44 @@ class BloombergService:
     Requires valid Bloomberg Terminal subscription and active session.
     """
 
-    def __init__(self, host: str = 'localhost', port: int = 8194):
+    __slots__ = (
+        'host', 'port', 'timeout', 'session', '_refdata_svc', '_connected', '_connect_lock',
+        '_blpapi_available', '_blpapi', '_pending', '_pending_lock',
+        '_next_correlation_id', '_reader', '_stop_reader', '_ref_cache',
+        '_ref_cache_lock', '_rng',
+    )
+
+    def __init__(self, host: str = 'localhost', port: int = 8194, timeout: int = 30000):
         """Initialize Bloomberg service.
 
         Args:
             host: Bloomberg API host (localhost for Desktop API)
             port: Bloomberg API port (default 8194)
+            timeout: Request timeout in milliseconds
         """
         self.host = host
         self.port = port
+        self.timeout = timeout
         self.session = None
+        self._refdata_svc = None
         self._connected = False
+        self._connect_lock = threading.Lock()
         self._blpapi_available = False
 
+        # In-flight requests by correlation id, resolved by the event reader thread
+        self._pending: Dict[int, _PendingRequest] = {}
+        self._pending_lock = threading.Lock()
+        self._next_correlation_id = itertools.count(1)
+        self._reader = None
+        self._stop_reader = threading.Event()
+
+        # LRU + TTL cache of reference data by (securities, fields)
+        self._ref_cache: "OrderedDict[Tuple[Tuple[str, ...], Tuple[str, ...]], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._ref_cache_lock = threading.Lock()
+
+        # Per-instance PCG64 generator for mock data
+        self._rng = np.random.default_rng()
+
         # Try to import blpapi
         try:
             import blpapi
@@ -37,49 +175,208 @@ class BloombergService:
     def connect(self) -> bool:
         """Establish connection to Bloomberg Terminal.
 
+        Safe to call concurrently; returns immediately if already connected.
+
         Returns:
             True if connection successful, False otherwise
         """
-        if not self._blpapi_available:
-            logger.info("Using mock Bloomberg connection (blpapi not installed)")
-            self._connected = True
-            return True
-
-        try:
-            session_options = self._blpapi.SessionOptions()
-            session_options.setServerHost(self.host)
-            session_options.setServerPort(self.port)
-
-            self.session = self._blpapi.Session(session_options)
-
-            if not self.session.start():
-                logger.error("Failed to start Bloomberg session")
-                return False
-
-            if not self.session.openService("//blp/refdata"):
-                logger.error("Failed to open //blp/refdata service")
+        with self._connect_lock:
+            if self._connected:
+                return True
+
+            if not self._blpapi_available:
+                logger.info("Using mock Bloomberg connection (blpapi not installed)")
+                self._connected = True
+                return True
+
+            # Tear down a session left over from a failed or terminated connection
+            self._close_session()
+
+            try:
+                session_options = self._blpapi.SessionOptions()
+                session_options.setServerHost(self.host)
+                session_options.setServerPort(self.port)
+
+                self.session = self._blpapi.Session(session_options)
+
+                if not self.session.start():
+                    logger.error("Failed to start Bloomberg session")
+                    self._close_session()
+                    return False
+
+                if not self.session.openService("//blp/refdata"):
+                    logger.error("Failed to open //blp/refdata service")
+                    self._close_session()
+                    return False
+                self._refdata_svc = self.session.getService("//blp/refdata")
+
+                # Drain session events on a background thread so many requests
+                # can be in flight at once
+                self._stop_reader.clear()
+                self._reader = threading.Thread(
+                    target=self._read_events, args=(self.session,), name="bbg-reader", daemon=True
+                )
+                self._reader.start()
+
+                self._connected = True
+                logger.info("Connected to Bloomberg at %s:%s", self.host, self.port)
+                return True
+
+            except Exception as e:
+                logger.error("Bloomberg connection error: %s", e)
+                self._close_session()
                 return False
 
-            self._connected = True
-            logger.info(f"Connected to Bloomberg at {self.host}:{self.port}")
-            return True
-
-        except Exception as e:
-            logger.error(f"Bloomberg connection error: {e}")
-            return False
-
     def disconnect(self):
         """Close Bloomberg connection."""
-        if self.session:
-            self.session.stop()
-        self._connected = False
+        with self._connect_lock:
+            self._close_session()
         logger.info("Disconnected from Bloomberg")
 
+    def _close_session(self):
+        """Stop the session and its reader thread and fail in-flight requests.
+
+        Callers must hold ``_connect_lock``.
+        """
+        self._connected = False
+        self._stop_reader.set()
+        if self.session:
+            try:
+                self.session.stop()
+            except Exception as e:
+                logger.error("Error stopping Bloomberg session: %s", e)
+            self.session = None
+        if self._reader:
+            self._reader.join(timeout=2 * EVENT_POLL_INTERVAL / 1000)
+            self._reader = None
+        self._fail_pending(ConnectionError("Bloomberg session closed"))
+        self._refdata_svc = None
+
     def is_connected(self) -> bool:
         """Check if connected to Bloomberg."""
         return self._connected
 
-    def get_reference_data(self, securities: List[str], fields: List[str]) -> Dict[str, Any]:
+    def _submit_request(self, request, parse: Callable[[Any, Any], None], results: Any) -> Future:
+        """Send a request and return a future for its parsed results.
+
+        Args:
+            request: blpapi request to send
+            parse: Callback applied to each response message as parse(msg, results)
+            results: Accumulator passed to parse and used as the future's result
+        """
+        cid_value = next(self._next_correlation_id)
+        deadline = time.monotonic() + self.timeout / 1000
+        pending = _PendingRequest(Future(), parse, results, deadline)
+
+        with self._pending_lock:
+            self._pending[cid_value] = pending
+
+        try:
+            self.session.sendRequest(request, correlationId=self._blpapi.CorrelationId(cid_value))
+        except Exception:
+            with self._pending_lock:
+                self._pending.pop(cid_value, None)
+            raise
+
+        return pending.future
+
+    def _read_events(self, session):
+        """Dispatch events from ``session`` to pending requests until disconnected.
+
+        Only response and request-status events are walked message by message;
+        other event types are skipped without touching their messages.
+        Requests past their deadline are failed at most once per poll interval.
+        """
+        event_types = self._blpapi.Event
+        partial_response = event_types.PARTIAL_RESPONSE
+        response = event_types.RESPONSE
+        request_status = event_types.REQUEST_STATUS
+        session_status = event_types.SESSION_STATUS
+        data_events = {partial_response, response}
+        next_expiry_check = time.monotonic() + EVENT_POLL_INTERVAL / 1000
+
+        while not self._stop_reader.is_set():
+            try:
+                event = session.nextEvent(EVENT_POLL_INTERVAL)
+            except Exception as e:
+                logger.error("Bloomberg event loop error: %s", e)
+                self._connected = False
+                self._fail_pending(e)
+                return
+
+            # A failure while handling one event must not stop the reader
+            try:
+                event_type = event.eventType()
+
+                if event_type in data_events:
+                    for msg in event:
+                        for cid in msg.correlationIds():
+                            cid_value = cid.value()
+                            with self._pending_lock:
+                                pending = self._pending.get(cid_value)
+                            if pending is None:
+                                continue
+
+                            try:
+                                pending.parse(msg, pending.results)
+                            except Exception as e:
+                                self._resolve(cid_value, exception=e)
+                                continue
+
+                            if event_type == response:
+                                self._resolve(cid_value)
+
+                elif event_type == request_status:
+                    for msg in event:
+                        for cid in msg.correlationIds():
+                            self._resolve(cid.value(), exception=RuntimeError(f"Bloomberg request failed: {msg}"))
+
+                elif event_type == session_status:
+                    for msg in event:
+                        if str(msg.messageType()) == "SessionTerminated":
+                            logger.error("Bloomberg session terminated")
+                            self._connected = False
+                            self._fail_pending(ConnectionError("Bloomberg session terminated"))
+                            return
+
+                now = time.monotonic()
+                if now >= next_expiry_check:
+                    self._expire_pending(now)
+                    next_expiry_check = now + EVENT_POLL_INTERVAL / 1000
+            except Exception as e:
+                logger.error("Error handling Bloomberg event: %s", e)
+
+    def _expire_pending(self, now: float):
+        """Fail pending requests whose deadline has passed."""
+        with self._pending_lock:
+            expired = [cid_value for cid_value, pending in self._pending.items() if pending.deadline <= now]
+        for cid_value in expired:
+            self._resolve(cid_value, exception=TimeoutError("Bloomberg request timed out"))
+
+    def _resolve(self, cid_value: int, exception: Optional[BaseException] = None):
+        """Complete a pending request with its results or an exception."""
+        with self._pending_lock:
+            pending = self._pending.pop(cid_value, None)
+        if pending is None:
+            return
+        _settle(pending.future, pending.results, exception)
+
+    def _fail_pending(self, exception: BaseException):
+        """Fail every in-flight request."""
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+        for request in pending.values():
+            _settle(request.future, exception=exception)
+
+    def _wait(self, future: Future, description: str) -> Any:
+        """Block until a request future resolves, logging failures."""
+        try:
+            return future.result(timeout=self.timeout / 1000)
+        except Exception as e:
+            logger.error("Error fetching %s: %s", description, e)
+            raise
+
+    def get_reference_data(self, securities: Sequence[str], fields: Sequence[str]) -> Dict[str, Any]:
         """Get reference data for securities.
 
         Args:
@@ -89,224 +386,331 @@ class BloombergService:
         Returns:
             Dictionary with security data
         """
+        return self._wait(self._request_reference_data(securities, fields), "reference data")
+
+    async def get_reference_data_async(self, securities: Sequence[str], fields: Sequence[str]) -> Dict[str, Any]:
+        """Get reference data for securities without blocking the event loop."""
+        future = self._request_reference_data(securities, fields)
+        return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout / 1000)
+
+    def fetch_parallel(self, jobs: List[Tuple[Sequence[str], Sequence[str]]]) -> List[Dict[str, Any]]:
+        """Fetch several reference data requests concurrently.
+
+        Args:
+            jobs: List of (securities, fields) pairs
+
+        Returns:
+            Reference data for each job, in the same order
+        """
+        # Submit everything before waiting so the round trips overlap
+        futures = [self._request_reference_data(securities, fields) for securities, fields in jobs]
+        return [self._wait(future, "reference data") for future in futures]
+
+    def _request_reference_data(self, securities: Sequence[str], fields: Sequence[str]) -> Future:
+        """Return a future for reference data, served from the cache when fresh."""
         if not self._connected:
             raise ConnectionError("Not connected to Bloomberg")
 
+        key = (tuple(sorted(securities)), tuple(sorted(fields)))
+        cached = self._ref_cache_get(key)
+        if cached is not None:
+            future = Future()
+            future.set_result(cached)
+            return future
+
+        future = self._fetch_reference_data(securities, fields)
+        future.add_done_callback(lambda done: self._ref_cache_set(key, done))
+        return future
+
+    def _fetch_reference_data(self, securities: Sequence[str], fields: Sequence[str]) -> Future:
+        """Submit a ReferenceDataRequest and return a future for its results."""
         if not self._blpapi_available:
             # Return mock data for development/testing
-            return self._get_mock_reference_data(securities, fields)
+            future = Future()
+            future.set_result(self._get_mock_reference_data(securities, fields))
+            return future
 
-        try:
-            ref_data_service = self.session.getService("//blp/refdata")
-            request = ref_data_service.createRequest("ReferenceDataRequest")
-
-            for security in securities:
-                request.append("securities", security)
-            for field in fields:
-                request.append("fields", field)
+        ref_data_service = self._refdata_svc
+        request = ref_data_service.createRequest("ReferenceDataRequest")
 
-            self.session.sendRequest(request)
+        for security in securities:
+            request.append("securities", security)
+        for field in fields:
+            request.append("fields", field)
+        names = self._field_names(fields)
 
-            results = {}
-            while True:
-                event = self.session.nextEvent(30000)
-                for msg in event:
-                    if msg.hasElement("securityData"):
-                        security_data = msg.getElement("securityData")
-                        for i in range(security_data.numValues()):
-                            security = security_data.getValueAsElement(i)
-                            sec_name = security.getElementAsString("security")
-                            field_data = security.getElement("fieldData")
+        def parse(msg, results):
+            if msg.hasElement("securityData"):
+                security_data = msg.getElement("securityData")
+                for i in range(security_data.numValues()):
+                    security = security_data.getValueAsElement(i)
+                    sec_name = security.getElementAsString("security")
+                    field_data = security.getElement("fieldData")
 
-                            results[sec_name] = {}
-                            for field in fields:
-                                if field_data.hasElement(field):
-                                    results[sec_name][field] = field_data.getElementAsString(field)
+                    results[sec_name] = self._element_values(field_data, names)
 
-                if event.eventType() == self._blpapi.Event.RESPONSE:
-                    break
+        return self._submit_request(request, parse, {})
 
-            return results
+    def _field_names(self, fields: Sequence[str]) -> Dict[Any, str]:
+        """Map each field's blpapi Name to its interned string, once per request."""
+        return {self._blpapi.Name(field): sys.intern(field) for field in fields}
 
-        except Exception as e:
-            logger.error(f"Error fetching reference data: {e}")
-            raise
+    def _element_values(self, element, names: Dict[Any, str]) -> Dict[str, Any]:
+        """Read every child of a Bloomberg element in one pass.
 
-    def get_historical_data(self, security: str, fields: List[str],
-                           start_date: str, end_date: str) -> List[Dict[str, Any]]:
-        """Get historical data for a security.
+        Children are keyed by the interned request field names, found by their
+        blpapi Name, so rows share key objects and no name string is built per
+        element. Numeric fields keep their native type; everything else
+        (including dates) is read as a string.
+        """
+        data_type = self._blpapi.DataType
+        float_types = (data_type.FLOAT64, data_type.FLOAT32)
+        int_types = (data_type.INT32, data_type.INT64)
+
+        values = {}
+        for j in range(element.numElements()):
+            child = element.getElement(j)
+            name = child.name()
+            key = names.get(name)
+            if key is None:
+                # Not a requested field; Bloomberg does not normally send these
+                key = sys.intern(str(name))
+            datatype = child.datatype()
+            if datatype in float_types:
+                values[key] = child.getValueAsFloat()
+            elif datatype in int_types:
+                values[key] = child.getValueAsInteger()
+            else:
+                values[key] = child.getValueAsString()
+        return values
+
+    @staticmethod
+    def _ref_ttl_for(field: str) -> float:
+        """Seconds a cached value of a reference data field stays fresh."""
+        return REFERENCE_FIELD_TTLS.get(field, REFERENCE_DEFAULT_TTL)
+
+    def _ref_cache_get(self, key: Tuple[Tuple[str, ...], Tuple[str, ...]]) -> Optional[Dict[str, Any]]:
+        """Return cached reference data for a key if it hasn't expired."""
+        with self._ref_cache_lock:
+            entry = self._ref_cache.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if time.monotonic() >= expires:
+                del self._ref_cache[key]
+                return None
+            self._ref_cache.move_to_end(key)
+            return value
+
+    def _ref_cache_set(self, key: Tuple[Tuple[str, ...], Tuple[str, ...]], done: Future):
+        """Cache the result of a completed reference data request."""
+        if done.cancelled() or done.exception() is not None:
+            return
+        ttl = min(self._ref_ttl_for(field) for field in key[1]) if key[1] else REFERENCE_DEFAULT_TTL
+        with self._ref_cache_lock:
+            self._ref_cache[key] = (time.monotonic() + ttl, done.result())
+            self._ref_cache.move_to_end(key)
+            while len(self._ref_cache) > REFERENCE_CACHE_MAX_KEYS:
+                self._ref_cache.popitem(last=False)
+
+    def invalidate(self):
+        """Drop all cached reference data."""
+        with self._ref_cache_lock:
+            self._ref_cache.clear()
+
+    def get_historical_data(self, securities: Union[str, List[str]], fields: List[str],
+                           start_date: str, end_date: str) -> Union[List[Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]:
+        """Get historical data for one or more securities in a single request.
 
         Args:
-            security: Bloomberg security identifier
+            securities: Bloomberg security identifier, or a list of them
             fields: List of Bloomberg fields
             start_date: Start date (YYYYMMDD format)
             end_date: End date (YYYYMMDD format)
 
         Returns:
-            List of dictionaries with historical data
+            List of dictionaries with historical data for a single security, or
+            a dictionary of such lists keyed by security when given a list
         """
+        future = self._request_historical_data(securities, fields, start_date, end_date)
+        return self._wait(future, "historical data")
+
+    async def get_historical_data_async(self, securities: Union[str, List[str]], fields: List[str],
+                                        start_date: str, end_date: str) -> Union[List[Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]:
+        """Get historical data without blocking the event loop."""
+        future = self._request_historical_data(securities, fields, start_date, end_date)
+        return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout / 1000)
+
+    def _request_historical_data(self, securities: Union[str, List[str]], fields: List[str],
+                                 start_date: str, end_date: str) -> Future:
+        """Submit a HistoricalDataRequest and return a future for its results."""
         if not self._connected:
             raise ConnectionError("Not connected to Bloomberg")
 
-        if not self._blpapi_available:
-            return self._get_mock_historical_data(security, fields, start_date, end_date)
+        single = isinstance(securities, str)
+        if single:
+            securities = [securities]
 
-        try:
-            ref_data_service = self.session.getService("//blp/refdata")
-            request = ref_data_service.createRequest("HistoricalDataRequest")
+        future = Future()
 
-            request.append("securities", security)
-            for field in fields:
-                request.append("fields", field)
-
-            request.set("startDate", start_date)
-            request.set("endDate", end_date)
-            request.set("periodicitySelection", "DAILY")
-
-            self.session.sendRequest(request)
-
-            results = []
-            while True:
-                event = self.session.nextEvent(30000)
-                for msg in event:
-                    if msg.hasElement("securityData"):
-                        security_data = msg.getElement("securityData")
-                        field_data = security_data.getElement("fieldDataArray")
-
-                        for i in range(field_data.numValues()):
-                            data_point = field_data.getValueAsElement(i)
-                            point = {"date": data_point.getElementAsString("date")}
-                            for field in fields:
-                                if data_point.hasElement(field):
-                                    point[field] = data_point.getElementAsFloat(field)
-                            results.append(point)
-
-                if event.eventType() == self._blpapi.Event.RESPONSE:
-                    break
+        if not self._blpapi_available:
+            results = {
+                security: self._get_mock_historical_data(security, fields, start_date, end_date)
+                for security in securities
+            }
+            future.set_result(results[securities[0]] if single else results)
+            return future
 
-            return results
+        ref_data_service = self._refdata_svc
+        request = ref_data_service.createRequest("HistoricalDataRequest")
 
-        except Exception as e:
-            logger.error(f"Error fetching historical data: {e}")
-            raise
+        for security in securities:
+            request.append("securities", security)
+        for field in fields:
+            request.append("fields", field)
+
+        request.set("startDate", start_date)
+        request.set("endDate", end_date)
+        request.set("periodicitySelection", "DAILY")
+        names = self._field_names(("date", *fields))
+
+        def parse_security(security_data, results):
+            sec_name = security_data.getElementAsString("security")
+            field_data = security_data.getElement("fieldDataArray")
+            points = results.setdefault(sec_name, [])
+
+            for i in range(field_data.numValues()):
+                points.append(self._element_values(field_data.getValueAsElement(i), names))
+
+        def parse(msg, results):
+            if msg.hasElement("securityData"):
+                # Bloomberg sends one securityData per security, usually one
+                # per message; accept an array as well
+                security_data = msg.getElement("securityData")
+                if security_data.isArray():
+                    for i in range(security_data.numValues()):
+                        parse_security(security_data.getValueAsElement(i), results)
+                else:
+                    parse_security(security_data, results)
+
+        batch = self._submit_request(request, parse, {})
+        if not single:
+            return batch
+
+        # Unwrap the single-security result
+        def unwrap(done: Future):
+            if done.exception() is not None:
+                _settle(future, exception=done.exception())
+            else:
+                _settle(future, done.result().get(securities[0], []))
+
+        batch.add_done_callback(unwrap)
+        return future
 
     def get_gpu_market_data(self) -> Dict[str, Any]:
         """Get GPU-related market data for AI infrastructure analysis.
 
         Returns data for major GPU/AI chip companies and related metrics.
         """
-        securities = [
-            "NVDA US Equity",   # NVIDIA
-            "AMD US Equity",    # AMD
-            "INTC US Equity",   # Intel
-            "TSM US Equity",    # TSMC
-            "AVGO US Equity",   # Broadcom
-        ]
-
-        fields = [
-            "PX_LAST",          # Last price
-            "CHG_PCT_1D",       # 1-day change %
-            "CUR_MKT_CAP",      # Market cap
-            "PE_RATIO",         # P/E ratio
-            "BEST_EPS_1YR",     # Forward EPS
-        ]
-
-        return self.get_reference_data(securities, fields)
+        return self.get_reference_data(_GPU_SECURITIES, _GPU_FIELDS)
 
     def get_datacenter_reit_data(self) -> Dict[str, Any]:
         """Get datacenter REIT data for TCO modeling.
 
         Returns data for major datacenter operators.
         """
-        securities = [
-            "EQIX US Equity",   # Equinix
-            "DLR US Equity",    # Digital Realty
-            "AMT US Equity",    # American Tower
-            "CCI US Equity",    # Crown Castle
-        ]
-
-        fields = [
-            "PX_LAST",
-            "DVD_YLD",          # Dividend yield
-            "FUNDS_FROM_OPS",   # FFO
-            "CUR_MKT_CAP",
-        ]
-
-        return self.get_reference_data(securities, fields)
-
-    def _get_mock_reference_data(self, securities: List[str], fields: List[str]) -> Dict[str, Any]:
-        """Return mock data for development without Bloomberg Terminal."""
-        mock_data = {
-            "NVDA US Equity": {
-                "PX_LAST": "875.28", "CHG_PCT_1D": "2.34",
-                "CUR_MKT_CAP": "2150000000000", "PE_RATIO": "65.2", "BEST_EPS_1YR": "13.42",
-                "NAME": "NVIDIA Corp"
-            },
-            "AMD US Equity": {
-                "PX_LAST": "178.45", "CHG_PCT_1D": "1.82",
-                "CUR_MKT_CAP": "288000000000", "PE_RATIO": "48.7", "BEST_EPS_1YR": "3.66",
-                "NAME": "Advanced Micro Devices Inc"
-            },
-            "INTC US Equity": {
-                "PX_LAST": "31.24", "CHG_PCT_1D": "-0.45",
-                "CUR_MKT_CAP": "132000000000", "PE_RATIO": "32.1", "BEST_EPS_1YR": "0.97",
-                "NAME": "Intel Corp"
-            },
-            "TSM US Equity": {
-                "PX_LAST": "142.67", "CHG_PCT_1D": "1.12",
-                "CUR_MKT_CAP": "740000000000", "PE_RATIO": "24.8", "BEST_EPS_1YR": "5.75",
-                "NAME": "Taiwan Semiconductor Manufacturing Co Ltd"
-            },
-            "AVGO US Equity": {
-                "PX_LAST": "1324.56", "CHG_PCT_1D": "0.89",
-                "CUR_MKT_CAP": "615000000000", "PE_RATIO": "35.6", "BEST_EPS_1YR": "37.21",
-                "NAME": "Broadcom Inc"
-            },
-            "EQIX US Equity": {
-                "PX_LAST": "812.34", "DVD_YLD": "2.1",
-                "FUNDS_FROM_OPS": "32.45", "CUR_MKT_CAP": "76000000000",
-                "NAME": "Equinix Inc"
-            },
-            "DLR US Equity": {
-                "PX_LAST": "142.89", "DVD_YLD": "3.4",
-                "FUNDS_FROM_OPS": "6.78", "CUR_MKT_CAP": "44000000000",
-                "NAME": "Digital Realty Trust Inc"
-            },
-        }
+        return self.get_reference_data(_REIT_SECURITIES, _REIT_FIELDS)
 
+    def _get_mock_reference_data(self, securities: Sequence[str], fields: Sequence[str]) -> Dict[str, Any]:
+        """Return mock data for development without Bloomberg Terminal."""
         results = {}
         for security in securities:
-            if security in mock_data:
-                results[security] = {
-                    field: mock_data[security].get(field, "N/A")
-                    for field in fields
-                }
+            row = _MOCK_REFERENCE_DATA.get(security)
+            if row is not None:
+                results[security] = {field: row.get(field, "N/A") for field in fields}
 
         return results
 
     def _get_mock_historical_data(self, security: str, fields: List[str],
                                   start_date: str, end_date: str) -> List[Dict[str, Any]]:
         """Return mock historical data for development."""
-        import random
-        from datetime import datetime, timedelta
-
-        start = datetime.strptime(start_date, "%Y%m%d")
-        end = datetime.strptime(end_date, "%Y%m%d")
-
-        results = []
-        current = start
-        base_price = 100.0
-
-        while current <= end:
-            if current.weekday() < 5:  # Exclude weekends
-                base_price *= (1 + random.uniform(-0.03, 0.035))
-                point = {"date": current.strftime("%Y-%m-%d")}
-                for field in fields:
-                    if field == "PX_LAST":
-                        point[field] = round(base_price, 2)
-                    elif field == "PX_VOLUME":
-                        point[field] = random.randint(1000000, 50000000)
-                results.append(point)
-            current += timedelta(days=1)
+        start = np.datetime64(datetime.strptime(start_date, "%Y%m%d").date())
+        end = np.datetime64(datetime.strptime(end_date, "%Y%m%d").date())
 
-        return results
+        days = np.arange(start, end + 1)
+        dates = days[np.is_busday(days)]  # Exclude weekends
+        n = len(dates)
+
+        # Random-walk prices and uniform volumes for every business day at once
+        generated = {
+            "PX_LAST": lambda: np.round(100.0 * np.cumprod(1.0 + self._rng.uniform(-0.03, 0.035, n)), 2),
+            "PX_VOLUME": lambda: self._rng.integers(1_000_000, 50_000_001, n),
+        }
+        names = [field for field in dict.fromkeys(fields) if field in generated]
+        columns = [generated[field]().tolist() for field in names]
+
+        keys = ["date", *names]
+        return [dict(zip(keys, row)) for row in zip(dates.astype(str).tolist(), *columns)]
+
+
+class ReferenceDataBatcher:
+    """Coalesces concurrent reference data requests into batched Bloomberg calls.
+
+    Requests for the same set of fields that arrive within ``window`` seconds
+    are merged into one ``get_reference_data`` call over the union of their
+    securities. Each caller receives only the securities it asked for.
+    """
+
+    def __init__(self, service: BloombergService, window: float = 0.01):
+        """Initialize the batcher.
+
+        Args:
+            service: Bloomberg service used to issue the batched requests
+            window: Seconds to wait for further requests before flushing
+        """
+        self.service = service
+        self.window = window
+        self._pending: Dict[frozenset, Tuple[List[str], List[Tuple[List[str], Future]]]] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, securities: List[str], fields: List[str]) -> Future:
+        """Queue a reference data request.
+
+        Returns:
+            Future resolving to the reference data for the given securities
+        """
+        key = frozenset(fields)
+        future = Future()
+
+        with self._lock:
+            batch = self._pending.get(key)
+            if batch is None:
+                batch = self._pending[key] = (list(fields), [])
+                timer = threading.Timer(self.window, self._flush, args=(key,))
+                timer.daemon = True
+                timer.start()
+            batch[1].append((securities, future))
+
+        return future
+
+    def _flush(self, key: frozenset):
+        """Issue one request for a pending batch and resolve its futures."""
+        with self._lock:
+            fields, requests = self._pending.pop(key)
+
+        try:
+            securities = list(dict.fromkeys(s for secs, _ in requests for s in secs))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Flushing %d reference data requests for %d securities", len(requests), len(securities))
+
+            data = self.service.get_reference_data(securities, fields)
+            results = [{s: data[s] for s in secs if s in data} for secs, _ in requests]
+        except Exception as e:
+            # Runs on a timer thread; every waiting caller must be released
+            for _, future in requests:
+                _settle(future, exception=e)
+            return
+
+        # Callers that timed out have cancelled their futures; skip those
+        for (_, future), result in zip(requests, results):
+            _settle(future, result)
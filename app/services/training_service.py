@@ -1,9 +1,92 @@
 """Training service for interactive learning modules on AI infrastructure economics."""
+import atexit
+import functools
+import importlib.resources
+import json
 import logging
-from typing import Dict, List, Any, Optional
+import os
+import queue
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Any, Mapping, NamedTuple, Optional, Tuple, Union
+
+from app.services.immutable import freeze
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of progress rows written per transaction
+PROGRESS_WRITE_BATCH = 100
+
+_PROGRESS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS progress (
+    user TEXT NOT NULL,
+    key TEXT NOT NULL,
+    score REAL NOT NULL,
+    ts REAL NOT NULL,
+    PRIMARY KEY (user, key)
+)
+"""
+
+
+class _TrainingContent(NamedTuple):
+    """Static training content and lookup tables, shared by all instances."""
+    modules: Mapping[str, Any]
+    lesson_index: Dict[Tuple[str, str], Mapping[str, Any]]
+    answer_key: Dict[Tuple[str, str], Tuple[int, ...]]
+    modules_summary: Tuple[Mapping[str, Any], ...]
+
+
+@dataclass(slots=True)
+class QuizResultRow:
+    """Outcome of a single quiz question."""
+    question: str
+    your_answer: str
+    correct_answer: str
+    is_correct: bool
+    explanation: str
+
+
+@dataclass(slots=True)
+class QuizResult:
+    """Score for a quiz submission, with per-question rows when verbose."""
+    score: float
+    correct: int
+    total: int
+    passed: bool
+    results: Optional[List[QuizResultRow]] = None
+
+
+@functools.lru_cache(maxsize=1)
+def _load_content() -> _TrainingContent:
+    """Load training modules from training_modules.json once per process."""
+    resource = importlib.resources.files(__package__).joinpath("training_modules.json")
+    with resource.open(encoding="utf-8") as f:
+        modules = freeze(json.load(f))
+
+    lesson_index = {
+        (module_id, lesson["id"]): lesson
+        for module_id, module in modules.items()
+        for lesson in module["lessons"]
+    }
+    answer_key = {
+        key: tuple(question["correct"] for question in lesson.get("quiz", ()))
+        for key, lesson in lesson_index.items()
+    }
+    modules_summary = freeze([
+        {
+            "id": module_id,
+            "title": module["title"],
+            "description": module["description"],
+            "lesson_count": len(module["lessons"])
+        }
+        for module_id, module in modules.items()
+    ])
+
+    return _TrainingContent(modules, lesson_index, answer_key, modules_summary)
+
+
 class TrainingService:
     """Interactive training service for AI infrastructure analysis.
 
@@ -14,339 +97,44 @@ class TrainingService:
     - Bloomberg data integration
     """
 
-    def __init__(self):
-        """Initialize training service."""
-        self.modules = self._initialize_modules()
-        self.user_progress = {}
+    __slots__ = (
+        'modules', '_db_path', '_db', '_db_pid', '_db_lock', '_write_q',
+        '_writer', '_queued', '_queued_lock', '_lesson_index', '_answer_key', '_total_lessons',
+        '_modules_summary',
+    )
 
-    def _initialize_modules(self) -> Dict[str, Any]:
-        """Initialize training modules."""
-        return {
-            "gpu_fundamentals": {
-                "title": "GPU Architecture Fundamentals",
-                "description": "Learn about GPU architectures for AI/ML workloads",
-                "lessons": [
-                    {
-                        "id": "gpu_1",
-                        "title": "Introduction to AI GPUs",
-                        "content": """
-# Introduction to AI GPUs
-
-Modern AI training and inference rely heavily on specialized GPU hardware.
-
-## Key Concepts
-
-**1. GPU vs CPU for AI**
-- GPUs excel at parallel processing
-- Thousands of cores vs dozens in CPUs
-- Optimized for matrix operations
-
-**2. Key Specifications**
-- **TFLOPS**: Trillion floating-point operations per second
-- **Memory Bandwidth**: GB/s data transfer rate
-- **TDP**: Thermal Design Power in watts
-
-**3. Major Players**
-- NVIDIA: H100, H200, B200 (Blackwell)
-- AMD: MI300X
-- Intel: Gaudi series
-""",
-                        "quiz": [
-                            {
-                                "question": "Why are GPUs better than CPUs for AI training?",
-                                "options": [
-                                    "Higher clock speed",
-                                    "Massive parallelism for matrix operations",
-                                    "Lower power consumption",
-                                    "Simpler programming model"
-                                ],
-                                "correct": 1,
-                                "explanation": "GPUs have thousands of cores optimized for parallel matrix operations, which are fundamental to neural network computations."
-                            },
-                            {
-                                "question": "What does TFLOPS measure?",
-                                "options": [
-                                    "Memory capacity",
-                                    "Power consumption",
-                                    "Floating-point operations per second",
-                                    "Data transfer speed"
-                                ],
-                                "correct": 2,
-                                "explanation": "TFLOPS (Trillion FLOPS) measures computational throughput - how many floating-point operations the GPU can perform per second."
-                            }
-                        ]
-                    },
-                    {
-                        "id": "gpu_2",
-                        "title": "NVIDIA Datacenter GPUs",
-                        "content": """
-# NVIDIA Datacenter GPU Evolution
-
-## Architecture Generations
-
-**1. Ampere (A100)**
-- 7nm process
-- 80GB HBM2e
-- 312 TFLOPS FP16
-
-**2. Hopper (H100/H200)**
-- 4nm process
-- 80-141GB HBM3/HBM3e
-- 1,979 TFLOPS FP16
-- Transformer Engine
-
-**3. Blackwell (B100/B200)**
-- 4nm process
-- 192GB HBM3e
-- ~4,500 TFLOPS FP16
-- Second-gen Transformer Engine
-
-## Key Innovations
-- NVLink for multi-GPU communication
-- HBM (High Bandwidth Memory)
-- Tensor Cores for AI operations
-""",
-                        "quiz": [
-                            {
-                                "question": "Which architecture introduced the Transformer Engine?",
-                                "options": ["Ampere", "Hopper", "Blackwell", "Volta"],
-                                "correct": 1,
-                                "explanation": "The Transformer Engine was introduced with the Hopper architecture (H100), providing optimized performance for transformer-based models."
-                            }
-                        ]
-                    }
-                ]
-            },
-            "tco_modeling": {
-                "title": "TCO Modeling for GPU Infrastructure",
-                "description": "Master total cost of ownership calculations",
-                "lessons": [
-                    {
-                        "id": "tco_1",
-                        "title": "TCO Components",
-                        "content": """
-# Total Cost of Ownership Components
-
-## Capital Expenditure (CapEx)
-
-**Hardware Costs:**
-- GPUs: $15,000 - $40,000 each
-- Servers: $5,000 - $15,000
-- Networking: $500 - $2,000 per GPU
-- Storage: Variable
-
-## Operating Expenditure (OpEx)
-
-**1. Power Costs**
-```
-Annual Power = TDP × Hours × PUE / 1000 × Rate
-
-Example (H100):
-= 700W × 8,760h × 1.3 / 1000 × $0.08/kWh
-= $6,370 per GPU per year
-```
-
-**2. Cooling (included in PUE)**
-- PUE 1.2 = 20% cooling overhead
-- PUE 1.5 = 50% cooling overhead
-
-**3. Maintenance**
-- Typically 5-10% of CapEx annually
-
-**4. Personnel**
-- Often overlooked but significant
-""",
-                        "quiz": [
-                            {
-                                "question": "What does PUE stand for?",
-                                "options": [
-                                    "Power Unit Efficiency",
-                                    "Power Usage Effectiveness",
-                                    "Processing Unit Energy",
-                                    "Parallel Utilization Efficiency"
-                                ],
-                                "correct": 1,
-                                "explanation": "PUE (Power Usage Effectiveness) measures datacenter efficiency - total facility power divided by IT equipment power. A PUE of 1.3 means 30% overhead."
-                            },
-                            {
-                                "question": "If an H100 has 700W TDP and runs 24/7, what's the annual kWh consumption?",
-                                "options": ["5,000 kWh", "6,132 kWh", "8,760 kWh", "10,000 kWh"],
-                                "correct": 1,
-                                "explanation": "700W × 8,760 hours = 6,132 kWh per year (not including PUE overhead)"
-                            }
-                        ]
-                    },
-                    {
-                        "id": "tco_2",
-                        "title": "Build vs Buy Analysis",
-                        "content": """
-# Build vs Buy: On-Premise vs Cloud
-
-## On-Premise Advantages
-- Lower long-term costs at high utilization
-- Full control over hardware
-- Data sovereignty
-- Predictable costs
-
-## Cloud Advantages
-- No upfront capital
-- Scalability
-- Latest hardware access
-- Geographic distribution
-
-## Break-Even Analysis
-
-**Key Variables:**
-- Utilization rate
-- Time horizon
-- Cloud pricing
-- Capital cost of equipment
-
-**Rule of Thumb:**
-- <50% utilization: Cloud usually wins
-- >70% utilization: On-premise usually wins
-- 50-70%: Detailed analysis needed
-""",
-                        "quiz": [
-                            {
-                                "question": "At what utilization rate does on-premise typically become more cost-effective?",
-                                "options": ["20-30%", "40-50%", "70%+", "90%+"],
-                                "correct": 2,
-                                "explanation": "Generally, on-premise infrastructure becomes more cost-effective above 70% utilization, when the fixed costs are spread across substantial usage."
-                            }
-                        ]
-                    }
-                ]
-            },
-            "neocloud_economics": {
-                "title": "Neocloud Provider Economics",
-                "description": "Analyze GPU cloud provider business models",
-                "lessons": [
-                    {
-                        "id": "neo_1",
-                        "title": "Neocloud Business Models",
-                        "content": """
-# Neocloud Provider Economics
-
-## What are Neoclouds?
-Specialized cloud providers focused on GPU/AI infrastructure, distinct from hyperscalers.
-
-## Key Players
-- **CoreWeave**: Kubernetes-native GPU cloud
-- **Lambda Labs**: Developer-focused ML cloud
-- **Together AI**: Inference optimization
-- **Crusoe**: Sustainable/stranded energy focus
-
-## Business Model Components
-
-**1. Infrastructure Costs**
-- GPU procurement (often with NVIDIA allocation)
-- Datacenter capacity
-- Networking
-
-**2. Revenue Streams**
-- On-demand GPU hours
-- Reserved capacity
-- Managed services
-
-**3. Unit Economics**
-```
-Gross Margin = (Hourly Rate - Hourly Cost) / Hourly Rate
-
-Example:
-Selling H100 at $3.50/hr
-Cost: $1.50/hr (including depreciation, power, ops)
-Gross Margin = 57%
-```
-""",
-                        "quiz": [
-                            {
-                                "question": "What differentiates neoclouds from hyperscalers?",
-                                "options": [
-                                    "Lower prices",
-                                    "GPU/AI infrastructure specialization",
-                                    "More datacenters",
-                                    "Better customer support"
-                                ],
-                                "correct": 1,
-                                "explanation": "Neoclouds specialize in GPU/AI infrastructure, offering purpose-built solutions rather than general-purpose cloud services."
-                            }
-                        ]
-                    }
-                ]
-            },
-            "bloomberg_integration": {
-                "title": "Bloomberg Terminal Integration",
-                "description": "Learn to integrate Bloomberg data feeds",
-                "lessons": [
-                    {
-                        "id": "bbg_1",
-                        "title": "Bloomberg API Overview",
-                        "content": """
-# Bloomberg API Integration
-
-## API Options
-
-**1. Desktop API (DAPI)**
-- Connects to running Terminal
-- localhost:8194
-- Requires Terminal subscription
-
-**2. Server API (B-PIPE)**
-- Server-side integration
-- No Terminal required
-- Enterprise licensing
-
-## Key Services
-
-**Reference Data (//blp/refdata)**
-- Current prices
-- Company fundamentals
-- Historical data
-
-**Market Data (//blp/mktdata)**
-- Real-time quotes
-- Live updates
-
-## Python Integration
-
-```python
-import blpapi
-
-# Connect to Terminal
-options = blpapi.SessionOptions()
-options.setServerHost('localhost')
-options.setServerPort(8194)
-
-session = blpapi.Session(options)
-session.start()
-session.openService("//blp/refdata")
-```
-""",
-                        "quiz": [
-                            {
-                                "question": "What port does Bloomberg Desktop API use?",
-                                "options": ["8080", "8194", "443", "3000"],
-                                "correct": 1,
-                                "explanation": "Bloomberg Desktop API listens on port 8194 by default."
-                            }
-                        ]
-                    }
-                ]
-            }
-        }
+    def __init__(self, db_path: str = ':memory:'):
+        """Initialize training service.
+
+        Args:
+            db_path: SQLite database for user progress (':memory:' to keep it
+                in process memory only)
+        """
+        content = _load_content()
+        self.modules = content.modules
+
+        # User progress store, opened lazily per process (see _get_db)
+        self._db_path = db_path
+        self._db = None
+        self._db_pid = None
+        self._db_lock = threading.Lock()
+        self._write_q: "queue.Queue[Optional[Tuple[str, str, float, float]]]" = queue.Queue()
+        self._writer = None
+
+        # Rows waiting in _write_q, by user then lesson key, so reads can
+        # include them without waiting for the writer
+        self._queued: Dict[str, Dict[str, Tuple[str, str, float, float]]] = {}
+        self._queued_lock = threading.Lock()
+
+        # Lookup tables over the static module content
+        self._lesson_index = content.lesson_index
+        self._answer_key = content.answer_key
+        self._total_lessons = len(self._lesson_index)
+        self._modules_summary = content.modules_summary
 
     def get_modules(self) -> List[Dict[str, Any]]:
         """Get list of available training modules."""
-        return [
-            {
-                "id": module_id,
-                "title": module["title"],
-                "description": module["description"],
-                "lesson_count": len(module["lessons"])
-            }
-            for module_id, module in self.modules.items()
-        ]
+        return self._modules_summary
 
     def get_module(self, module_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific training module."""
@@ -354,17 +142,11 @@ session.openService("//blp/refdata")
 
     def get_lesson(self, module_id: str, lesson_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific lesson from a module."""
-        module = self.modules.get(module_id)
-        if not module:
-            return None
-
-        for lesson in module["lessons"]:
-            if lesson["id"] == lesson_id:
-                return lesson
-        return None
+        return self._lesson_index.get((module_id, lesson_id))
 
     def submit_quiz(self, module_id: str, lesson_id: str,
-                   answers: List[int], user_id: str = "default") -> Dict[str, Any]:
+                   answers: List[int], user_id: str = "default",
+                   verbose: bool = True) -> Union[QuizResult, Dict[str, str]]:
         """Submit quiz answers and get results.
 
         Args:
@@ -372,57 +154,53 @@ session.openService("//blp/refdata")
             lesson_id: Lesson identifier
             answers: List of answer indices
             user_id: User identifier for tracking progress
+            verbose: Include per-question results and explanations
 
         Returns:
-            Quiz results with score and explanations
+            Quiz results with score and explanations, or a dict with an
+            "error" message
         """
-        lesson = self.get_lesson(module_id, lesson_id)
-        if not lesson:
+        key = (module_id, lesson_id)
+        correct = self._answer_key.get(key)
+        if correct is None:
             return {"error": "Lesson not found"}
 
-        quiz = lesson.get("quiz", [])
-        if len(answers) != len(quiz):
+        if not isinstance(answers, list) or not all(
+            isinstance(answer, int) and not isinstance(answer, bool) for answer in answers
+        ):
+            return {"error": "Answers must be a list of integers"}
+
+        if len(answers) != len(correct):
             return {"error": "Answer count mismatch"}
 
-        results = []
-        correct_count = 0
-
-        for i, (answer, question) in enumerate(zip(answers, quiz)):
-            is_correct = answer == question["correct"]
-            if is_correct:
-                correct_count += 1
-
-            results.append({
-                "question": question["question"],
-                "your_answer": question["options"][answer] if 0 <= answer < len(question["options"]) else "Invalid",
-                "correct_answer": question["options"][question["correct"]],
-                "is_correct": is_correct,
-                "explanation": question["explanation"]
-            })
-
-        score = (correct_count / len(quiz)) * 100 if quiz else 0
-
-        # Update user progress
-        if user_id not in self.user_progress:
-            self.user_progress[user_id] = {}
-        self.user_progress[user_id][f"{module_id}_{lesson_id}"] = {
-            "score": score,
-            "completed": True
-        }
+        correct_count = sum(answer == expected for answer, expected in zip(answers, correct))
+        score = (correct_count / len(correct)) * 100 if correct else 0
 
-        return {
-            "score": score,
-            "correct": correct_count,
-            "total": len(quiz),
-            "results": results,
-            "passed": score >= 70
-        }
+        self._record_progress(user_id, f"{module_id}_{lesson_id}", score)
+
+        result = QuizResult(score, correct_count, len(correct), score >= 70)
+        if verbose:
+            result.results = [
+                QuizResultRow(
+                    question["question"],
+                    question["options"][answer] if 0 <= answer < len(question["options"]) else "Invalid",
+                    question["options"][question["correct"]],
+                    answer == question["correct"],
+                    question["explanation"]
+                )
+                for answer, question in zip(answers, self._lesson_index[key].get("quiz", ()))
+            ]
+
+        return result
 
     def get_user_progress(self, user_id: str = "default") -> Dict[str, Any]:
         """Get user's learning progress."""
-        progress = self.user_progress.get(user_id, {})
+        progress = {
+            key: {"score": score, "completed": True}
+            for key, score in self._read_progress(user_id)
+        }
 
-        total_lessons = sum(len(m["lessons"]) for m in self.modules.values())
+        total_lessons = self._total_lessons
         completed_lessons = len(progress)
         avg_score = sum(p["score"] for p in progress.values()) / len(progress) if progress else 0
 
@@ -434,3 +212,136 @@ session.openService("//blp/refdata")
             "average_score": avg_score,
             "lesson_details": progress
         }
+
+    def close(self):
+        """Flush queued progress writes and close the progress database."""
+        if self._writer is None or self._db_pid != os.getpid():
+            return
+        self._write_q.put(None)
+        self._writer.join()
+        self._writer = None
+        with self._db_lock:
+            self._db.close()
+            self._db = None
+
+    def _get_db(self) -> sqlite3.Connection:
+        """Return this process's progress database, starting its writer thread."""
+        if self._db is None or self._db_pid != os.getpid():
+            with self._db_lock:
+                if self._db is None or self._db_pid != os.getpid():
+                    try:
+                        db = self._open_db(self._db_path)
+                    except (OSError, sqlite3.Error) as e:
+                        logger.error("Cannot open progress database at %s: %s. Progress will be kept in memory.",
+                                     self._db_path, e)
+                        self._db_path = ':memory:'
+                        db = self._open_db(self._db_path)
+
+                    # Threads do not survive fork, so each worker gets its own writer
+                    self._write_q = queue.Queue()
+                    with self._queued_lock:
+                        self._queued = {}
+                    self._db = db
+                    self._db_pid = os.getpid()
+                    self._writer = threading.Thread(
+                        target=self._write_progress, name="training-progress-writer", daemon=True
+                    )
+                    self._writer.start()
+                    atexit.register(self.close)
+        return self._db
+
+    @staticmethod
+    def _open_db(path: str) -> sqlite3.Connection:
+        """Open a progress database and create its schema."""
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        db = sqlite3.connect(path, check_same_thread=False)
+        try:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute(_PROGRESS_SCHEMA)
+            db.commit()
+        except sqlite3.Error:
+            db.close()
+            raise
+        return db
+
+    def _write_progress(self):
+        """Persist queued progress rows in batches until close() is called."""
+        while True:
+            rows = [self._write_q.get()]
+            while len(rows) < PROGRESS_WRITE_BATCH:
+                try:
+                    rows.append(self._write_q.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = None in rows
+            rows = [row for row in rows if row is not None]
+            try:
+                self._save_rows(rows)
+            finally:
+                self._dequeue(rows)
+            if stop:
+                return
+
+    def _save_rows(self, rows: List[Tuple[str, str, float, float]]):
+        """Write progress rows in one transaction, falling back to one row at a time.
+
+        A single bad row rolls back the whole batch, so on failure each row is
+        retried on its own and only the rows that still fail are dropped.
+        """
+        insert = "INSERT OR REPLACE INTO progress (user, key, score, ts) VALUES (?, ?, ?, ?)"
+        with self._db_lock:
+            try:
+                with self._db:
+                    self._db.executemany(insert, rows)
+                return
+            except sqlite3.Error as e:
+                if len(rows) == 1:
+                    logger.error("Failed to save training progress: %s", e)
+                    return
+
+            for row in rows:
+                try:
+                    with self._db:
+                        self._db.execute(insert, row)
+                except sqlite3.Error as e:
+                    logger.error("Failed to save training progress for user %r: %s", row[0], e)
+
+    def _record_progress(self, user_id: str, key: str, score: float):
+        """Queue a progress row for the writer thread."""
+        self._get_db()
+        row = (user_id, key, score, time.time())
+        with self._queued_lock:
+            self._queued.setdefault(user_id, {})[key] = row
+        self._write_q.put_nowait(row)
+
+    def _dequeue(self, rows: List[Tuple[str, str, float, float]]):
+        """Forget queued rows once the writer has handled them."""
+        with self._queued_lock:
+            for row in rows:
+                user_rows = self._queued.get(row[0])
+                # A newer submission for the same lesson stays queued
+                if user_rows is not None and user_rows.get(row[1]) is row:
+                    del user_rows[row[1]]
+                    if not user_rows:
+                        del self._queued[row[0]]
+
+    def _read_progress(self, user_id: str) -> List[Tuple[str, float]]:
+        """Return (lesson key, score) rows for a user, including queued writes."""
+        db = self._get_db()
+        # Snapshot the queue first so a row committed in between is not missed
+        with self._queued_lock:
+            queued = [(key, score, ts) for _, key, score, ts in self._queued.get(user_id, {}).values()]
+        with self._db_lock:
+            stored = db.execute(
+                "SELECT key, score, ts FROM progress WHERE user = ?", (user_id,)
+            ).fetchall()
+
+        # Keep the latest submission per lesson
+        latest = {}
+        for key, score, ts in stored + queued:
+            if key not in latest or ts >= latest[key][1]:
+                latest[key] = (score, ts)
+        return [(key, score) for key, (score, _) in sorted(latest.items(), key=lambda item: item[1][1])]
@@ -1,39 +1,75 @@
 """Application configuration management."""
 import os
+from dataclasses import dataclass
+from typing import Final, Tuple
 
+@dataclass(slots=True, frozen=True)
 class Config:
     """Base configuration."""
-    SECRET_KEY = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production')
+    SECRET_KEY: str = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production')
 
     # Bloomberg API Configuration
-    BLOOMBERG_HOST = os.environ.get('BLOOMBERG_HOST', 'localhost')
-    BLOOMBERG_PORT = int(os.environ.get('BLOOMBERG_PORT', 8194))
-    BLOOMBERG_TIMEOUT = int(os.environ.get('BLOOMBERG_TIMEOUT', 30000))
+    BLOOMBERG_HOST: str = os.environ.get('BLOOMBERG_HOST', 'localhost')
+    BLOOMBERG_PORT: int = int(os.environ.get('BLOOMBERG_PORT', 8194))
+    BLOOMBERG_TIMEOUT: int = int(os.environ.get('BLOOMBERG_TIMEOUT', 30000))
 
     # AI Agent Configuration
-    AI_MODEL = os.environ.get('AI_MODEL', 'gpt-4')
-    OPENAI_API_KEY = os.environ.get('OPENAI_API_KEY', '')
-    ANTHROPIC_API_KEY = os.environ.get('ANTHROPIC_API_KEY', '')
+    AI_MODEL: str = os.environ.get('AI_MODEL', 'gpt-4')
+    OPENAI_API_KEY: str = os.environ.get('OPENAI_API_KEY', '')
+    ANTHROPIC_API_KEY: str = os.environ.get('ANTHROPIC_API_KEY', '')
+    # Persistent chat response cache directory (disabled if empty)
+    CHAT_CACHE_DIR: str = os.environ.get('CHAT_CACHE_DIR', '')
+
+    # SQLite database for training progress, shared by all worker processes
+    PROGRESS_DB_PATH: str = os.environ.get(
+        'PROGRESS_DB_PATH', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'instance', 'progress.db')
+    )
+
+    # Cache-Control max-age (seconds) for deterministic GET endpoints
+    HTTP_CACHE_MAX_AGE: int = int(os.environ.get('HTTP_CACHE_MAX_AGE', 60))
+
+    # Build service singletons in create_app rather than on first request
+    PRELOAD_SERVICES: bool = os.environ.get('PRELOAD_SERVICES', 'true').lower() == 'true'
+
+    # Origin allowed to make cross-origin requests ('*' for any)
+    CORS_ORIGIN: str = os.environ.get('CORS_ORIGIN', '*')
+
+    # Response compression (flask-compress)
+    COMPRESS_ALGORITHM: Tuple[str, ...] = ('br', 'gzip')
+    COMPRESS_MIN_SIZE: int = 1024
+
+    # Maximum accepted request body size (bytes)
+    MAX_CONTENT_LENGTH: int = int(os.environ.get('MAX_CONTENT_LENGTH', 64 * 1024))
 
     # Application settings
-    DEBUG = False
-    TESTING = False
+    DEBUG: bool = False
+    TESTING: bool = False
 
+@dataclass(slots=True, frozen=True)
 class DevelopmentConfig(Config):
     """Development configuration."""
-    DEBUG = True
+    DEBUG: bool = True
 
+@dataclass(slots=True, frozen=True)
 class ProductionConfig(Config):
     """Production configuration."""
-    DEBUG = False
+    DEBUG: bool = False
+    CHAT_CACHE_DIR: str = os.environ.get('CHAT_CACHE_DIR', '/var/cache/ai_service')
+    PROGRESS_DB_PATH: str = os.environ.get('PROGRESS_DB_PATH', '/var/lib/ai_service/progress.db')
 
+@dataclass(slots=True, frozen=True)
 class TestingConfig(Config):
     """Testing configuration."""
-    TESTING = True
+    TESTING: bool = True
+    # ':memory:' keeps progress per process, which is fine for a single test client
+    PROGRESS_DB_PATH: str = ':memory:'
 
 config = {
-    'development': DevelopmentConfig,
-    'production': ProductionConfig,
-    'testing': TestingConfig,
-    'default': DevelopmentConfig
+    'development': DevelopmentConfig(),
+    'production': ProductionConfig(),
+    'testing': TestingConfig(),
+    'default': DevelopmentConfig()
 }
+
+# Configuration selected by FLASK_ENV, built once at import
+CONFIG: Final[Config] = config[os.environ.get('FLASK_ENV', 'default')]
@@ -0,0 +1,18 @@
+"""Gunicorn configuration for production deployments.
+
+Usage: gunicorn app:app
+"""
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 9000)}"
+
+# Serve ProductionConfig unless FLASK_ENV is set explicitly
+raw_env = [f"FLASK_ENV={os.environ.get('FLASK_ENV', 'production')}"]
+
+# One process per core, each serving requests from a thread pool
+workers = int(os.environ.get('GUNICORN_WORKERS', os.cpu_count() or 1))
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 8))
+
+# Import the app once in the master so workers share it copy-on-write
+preload_app = True
@@ -0,0 +1,93 @@
+"""Tests for the Bloomberg service event reader."""
+import asyncio
+import sys
+import time
+import types
+
+import pytest
+
+from app.services import bloomberg_service
+from app.services.bloomberg_service import BloombergService, ReferenceDataBatcher
+
+
+class _Event:
+    def __init__(self, event_type):
+        self._event_type = event_type
+
+    def eventType(self):
+        return self._event_type
+
+    def __iter__(self):
+        return iter(())
+
+
+class _Session:
+    """Session that accepts requests but never answers them."""
+
+    def __init__(self, options):
+        pass
+
+    def start(self):
+        return True
+
+    def openService(self, name):
+        return True
+
+    def getService(self, name):
+        return types.SimpleNamespace(createRequest=lambda kind: types.SimpleNamespace(append=lambda *args: None))
+
+    def sendRequest(self, request, correlationId=None):
+        pass
+
+    def nextEvent(self, timeout):
+        time.sleep(timeout / 1000)
+        return _Event(_Event.TIMEOUT)
+
+    def stop(self):
+        pass
+
+
+_Event.TIMEOUT = 10
+
+
+@pytest.fixture
+def blpapi_stub(monkeypatch):
+    stub = types.ModuleType("blpapi")
+    stub.Session = _Session
+    stub.SessionOptions = lambda: types.SimpleNamespace(setServerHost=lambda host: None,
+                                                        setServerPort=lambda port: None)
+    stub.CorrelationId = lambda value: value
+    stub.Name = str
+    stub.Event = types.SimpleNamespace(PARTIAL_RESPONSE=6, RESPONSE=5, REQUEST_STATUS=4,
+                                       SESSION_STATUS=2, TIMEOUT=_Event.TIMEOUT)
+    monkeypatch.setitem(sys.modules, "blpapi", stub)
+    monkeypatch.setattr(bloomberg_service, "EVENT_POLL_INTERVAL", 20)
+    return stub
+
+
+def test_reader_survives_cancelled_async_request(blpapi_stub):
+    service = BloombergService(timeout=100)
+    assert service.connect()
+    try:
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(service.get_reference_data_async(["NVDA US Equity"], ["PX_LAST"]))
+
+        # Give the reader time to expire the cancelled request
+        time.sleep(0.3)
+
+        assert service._reader.is_alive()
+        assert not service._pending
+    finally:
+        service.disconnect()
+
+
+def test_batcher_resolves_callers_after_a_cancelled_one():
+    service = BloombergService()
+    service.connect()
+    batcher = ReferenceDataBatcher(service, window=0.05)
+
+    first = batcher.submit(["NVDA US Equity"], ["PX_LAST"])
+    second = batcher.submit(["AMD US Equity"], ["PX_LAST"])
+    first.cancel()
+
+    assert second.result(timeout=1) == {"AMD US Equity": {"PX_LAST": "178.45"}}
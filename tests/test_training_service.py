@@ -0,0 +1,18 @@
+"""Tests for the training service progress store."""
+from app.services.training_service import TrainingService
+
+
+def test_bad_row_does_not_drop_its_batch(tmp_path):
+    service = TrainingService(db_path=str(tmp_path / "progress.db"))
+    db = service._get_db()
+
+    service._save_rows([
+        ("alice", "gpu_fundamentals_gpu_1", 100.0, 1.0),
+        (None, "gpu_fundamentals_gpu_1", 50.0, 2.0),
+        ("bob", "gpu_fundamentals_gpu_1", 50.0, 3.0),
+    ])
+
+    assert db.execute("SELECT user, score FROM progress ORDER BY ts").fetchall() == [
+        ("alice", 100.0), ("bob", 50.0),
+    ]
+    service.close()